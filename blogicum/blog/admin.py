@@ -1,34 +1,127 @@
-from django.contrib import admin
+import json
+
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.admin.options import get_content_type_for_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group, User
+from django.db.models import Count
 from django.utils.safestring import mark_safe
 
 from .models import Category, Comment, Location, Post
+from .paginators import EstimatedCountPaginator
+from .search import search_posts
+from .signals import bulk_updated
 
 admin.site.unregister(Group)
 admin.site.unregister(User)
 
 
+class BulkUpdateMixin:
+    bulk_scope_fields = ()
+
+    def bulk_update(self, request, queryset, **values):
+        model = queryset.model
+        rows = list(queryset.values_list('pk', *self.bulk_scope_fields))
+        if not rows:
+            return
+        updated = queryset.update(**values)
+        pks = [row[0] for row in rows]
+        fields = [
+            str(model._meta.get_field(name).verbose_name) for name in values
+        ]
+        LogEntry.objects.create(
+            user_id=request.user.pk,
+            content_type_id=get_content_type_for_model(model).pk,
+            object_repr=(
+                f'{model._meta.verbose_name_plural}: '
+                + ', '.join(map(str, pks))
+            )[:200],
+            action_flag=CHANGE,
+            change_message=json.dumps([{'changed': {'fields': fields}}]),
+        )
+        bulk_updated.send(
+            sender=model, pks=pks, scopes={row[1:] for row in rows},
+            values=values
+        )
+        self.message_user(
+            request, f'Обновлено записей: {updated}', messages.SUCCESS
+        )
+
+    @admin.action(description='Опубликовать выбранные')
+    def publish(self, request, queryset):
+        self.bulk_update(request, queryset, is_published=True)
+
+    @admin.action(description='Снять с публикации выбранные')
+    def unpublish(self, request, queryset):
+        self.bulk_update(request, queryset, is_published=False)
+
+
+class PostActionForm(ActionForm):
+    category = forms.ModelChoiceField(
+        Category.objects.all(), required=False, label='Категория'
+    )
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
-    @admin.display(description='Кол-во постов у пользователя')
-    def posts_count(self, obj):
-        return obj.posts.count()
     list_display = BaseUserAdmin.list_display + ('posts_count',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            posts_total=Count('posts')
+        )
+
+    @admin.display(
+        description='Кол-во постов у пользователя', ordering='posts_total'
+    )
+    def posts_count(self, obj):
+        return obj.posts_total
 
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(BulkUpdateMixin, admin.ModelAdmin):
     list_display = (
         'id', 'title', 'author', 'location', 'category',
-        'is_published', 'pub_date', 'created_at', 'image_preview'
+        'is_published', 'pub_date', 'created_at', 'image_preview',
+        'image_dimensions'
     )
     list_display_links = ('title',)
+    list_select_related = ('author', 'location', 'category')
     search_fields = (
         'title', 'text', 'author__username',
         'category__title', 'location__name'
     )
-    list_filter = ('is_published', 'created_at', 'category', 'location')
+    list_filter = ('is_published', 'category')
+    date_hierarchy = 'created_at'
+    autocomplete_fields = ('author', 'category', 'location')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    action_form = PostActionForm
+    actions = ('publish', 'unpublish', 'change_category')
+    bulk_scope_fields = ('category_id', 'author_id')
+
+    @admin.action(description='Перенести выбранные в категорию')
+    def change_category(self, request, queryset):
+        form = self.action_form(request.POST)
+        form.fields['action'].choices = self.get_action_choices(request)
+        if not form.is_valid() or form.cleaned_data['category'] is None:
+            self.message_user(
+                request, 'Выберите категорию для переноса.', messages.WARNING
+            )
+            return
+        self.bulk_update(
+            request, queryset, category=form.cleaned_data['category']
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        return search_posts(queryset, search_term), False
 
     @admin.display(description='Изображение')
     def image_preview(self, obj):
@@ -38,26 +131,38 @@ class PostAdmin(admin.ModelAdmin):
             )
         return ''
 
+    @admin.display(description='Размер изображения')
+    def image_dimensions(self, obj):
+        if obj.image_meta.get('width'):
+            return f'{obj.image_meta["width"]}×{obj.image_meta["height"]}'
+        return ''
+
 
 @admin.register(Location)
-class LocationAdmin(admin.ModelAdmin):
+class LocationAdmin(BulkUpdateMixin, admin.ModelAdmin):
     list_display = ('id', 'name', 'is_published', 'created_at')
     list_display_links = ('name',)
     search_fields = ('name',)
-    list_filter = ('name', 'is_published')
+    list_filter = ('is_published',)
+    actions = ('publish', 'unpublish')
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(BulkUpdateMixin, admin.ModelAdmin):
     list_display = ('id', 'title', 'slug', 'is_published', 'created_at')
     list_display_links = ('title',)
     search_fields = ('title', 'slug')
     list_filter = ('is_published',)
+    actions = ('publish', 'unpublish')
 
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('id', 'author', 'text', 'created_at')
     list_display_links = ('text',)
-    search_fields = ('author', 'text')
-    list_filter = ('created_at',)
+    list_select_related = ('author',)
+    search_fields = ('author__username', 'text')
+    date_hierarchy = 'created_at'
+    autocomplete_fields = ('post', 'author')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
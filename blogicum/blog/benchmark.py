@@ -0,0 +1,169 @@
+import json
+import math
+import time
+from statistics import median
+
+from django.conf import settings
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from blogicum.timing import collect_timings
+
+from .models import Post, User
+from .views import filter_posts
+
+ROLES = ('anonymous', 'author', 'other')
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'queries', 'sql_ms', 'template_ms',
+           'bytes')
+BENCHMARK_REMOTE_ADDR = '192.0.2.1'
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def find_fixtures():
+    post = filter_posts(Post.objects).select_related(
+        'author', 'category'
+    ).order_by('-comment_count', '-pk').first()
+    if post is None:
+        return None
+    comment = post.comments.select_related('author').order_by('pk').first()
+    comment_author = comment.author if comment else post.author
+    return {
+        'post': post,
+        'comment': comment,
+        'post_author': post.author,
+        'comment_author': comment_author,
+        'other': User.objects.exclude(
+            pk__in={post.author_id, comment_author.pk}
+        ).order_by('pk').first(),
+    }
+
+
+def url_kwargs(pattern, fixtures):
+    post, comment = fixtures['post'], fixtures['comment']
+    values = {
+        'post_id': post.pk,
+        'comment_id': comment.pk if comment else None,
+        'category_slug': post.category.slug,
+        'username': post.author.username,
+    }
+    names = pattern.pattern.regex.groupindex
+    if any(values[name] is None for name in names):
+        return None
+    return {name: values[name] for name in names}
+
+
+def benchmark_urls(modules, fixtures):
+    for module in modules:
+        for pattern in module.urlpatterns:
+            if not isinstance(pattern, URLPattern) or not pattern.name:
+                continue
+            kwargs = url_kwargs(pattern, fixtures)
+            if kwargs is not None:
+                name = f'{module.app_name}:{pattern.name}'
+                yield name, reverse(name, kwargs=kwargs), kwargs
+
+
+def role_user(role, kwargs, fixtures):
+    if role == 'author':
+        if 'comment_id' in kwargs:
+            return fixtures['comment_author']
+        return fixtures['post_author']
+    return fixtures.get(role)
+
+
+def make_client(user):
+    client = Client(
+        HTTP_HOST=settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS
+        else 'localhost',
+        REMOTE_ADDR=BENCHMARK_REMOTE_ADDR,
+    )
+    if user is not None:
+        client.force_login(user)
+    return client
+
+
+def measure(client, url, repeat, warmup):
+    for _ in range(warmup):
+        client.get(url)
+    latencies, queries, sql, templates = [], [], [], []
+    for _ in range(repeat):
+        with collect_timings() as timings:
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append(time.perf_counter() - started)
+        queries.append(timings.queries)
+        sql.append(timings.sql)
+        templates.append(timings.template)
+    return {
+        'status': response.status_code,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'queries': median(queries),
+        'sql_ms': median(sql) * 1000,
+        'template_ms': median(templates) * 1000,
+        'bytes': len(response.content),
+    }
+
+
+def run_benchmark(modules, repeat=20, warmup=2):
+    fixtures = find_fixtures()
+    if fixtures is None:
+        return None
+    clients = {}
+    results = {}
+    for role in ROLES:
+        for name, url, kwargs in benchmark_urls(modules, fixtures):
+            user = role_user(role, kwargs, fixtures)
+            if role != 'anonymous' and user is None:
+                continue
+            key = user.pk if user else None
+            if key not in clients:
+                clients[key] = make_client(user)
+            results[f'{name} [{role}]'] = {
+                'url': url, **measure(clients[key], url, repeat, warmup)
+            }
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta_ms=2.0):
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if result['queries'] > previous['queries']:
+            regressions.append(
+                f'{key}: запросов {previous["queries"]}'
+                f' → {result["queries"]}'
+            )
+        if (
+            result['p95_ms'] > previous['p95_ms'] * (1 + tolerance)
+            and result['p95_ms'] - previous['p95_ms'] > min_delta_ms
+        ):
+            regressions.append(
+                f'{key}: p95 {previous["p95_ms"]:.1f}'
+                f' → {result["p95_ms"]:.1f} мс'
+            )
+        if result['bytes'] > previous['bytes'] * (1 + tolerance):
+            regressions.append(
+                f'{key}: байт {previous["bytes"]} → {result["bytes"]}'
+            )
+    return regressions
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def save_baseline(path, results):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(
+            {'metrics': METRICS, 'results': results}, file,
+            ensure_ascii=False, indent=2, sort_keys=True
+        )
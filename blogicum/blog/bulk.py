@@ -0,0 +1,76 @@
+import json
+from contextlib import contextmanager
+
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .cache import CATEGORIES_TAG, invalidate_tags
+from .models import Comment, PostCount
+from .search import index_posts
+from .signals import invalidate_post_scopes
+
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_records(file):
+    """Читает объекты из JSON-массива или JSONL, не загружая файл целиком."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n,[]':
+            position += 1
+        if position == len(buffer):
+            if eof:
+                return
+            buffer, position = file.read(CHUNK_SIZE), 0
+            eof = not buffer
+            continue
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = file.read(CHUNK_SIZE)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield record
+        position = end
+
+
+@contextmanager
+def keep_timestamps(*models):
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def reset_sequences(*models):
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def finish_post_load(posts, scopes):
+    counts = (
+        Comment.objects.filter(post=OuterRef('pk'))
+        .order_by().values('post').annotate(total=Count('pk'))
+        .values('total')
+    )
+    posts.update(comment_count=Coalesce(Subquery(counts), 0))
+    index_posts(posts)
+    invalidate_post_scopes((), scopes)
+    invalidate_tags(CATEGORIES_TAG)
+    PostCount.objects.all().delete()
@@ -0,0 +1,168 @@
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.encoding import iri_to_uri
+
+TAG_KEY = 'blog:tag:{}'
+PAGE_KEY = 'blog:page:{}'
+CARD_KEY = 'blog:card:{}:{}'
+COUNT_KEY = 'blog:count:{}:{}'
+VALIDATORS_KEY = 'blog:validators:{}'
+FEED_TAG = 'feed'
+CATEGORIES_TAG = 'categories'
+CARDS_TAG = 'cards'
+
+
+def post_tag(post_id):
+    return f'post:{post_id}'
+
+
+def category_tag(category_id):
+    return f'category:{category_id}'
+
+
+def location_tag(location_id):
+    return f'location:{location_id}'
+
+
+def author_tag(author_id):
+    return f'author:{author_id}'
+
+
+def user_tag(user_id):
+    return f'user:{user_id}'
+
+
+def feed_scope():
+    return 'index'
+
+
+def category_scope(category_id):
+    return f'category:{category_id}'
+
+
+def profile_scope(author_id, own=False):
+    return f'profile:{author_id}:all' if own else f'profile:{author_id}'
+
+
+def get_tag_versions(tags, create=False):
+    keys = {TAG_KEY.format(tag): tag for tag in tags}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+    if create:
+        missing = {
+            key: uuid4().hex for key in keys if key not in found
+        }
+        if missing:
+            cache.set_many(missing, None)
+            versions.update(
+                {keys[key]: version for key, version in missing.items()}
+            )
+    return versions
+
+
+def version_stamp(versions):
+    return md5(''.join(
+        str(versions.get(tag)) for tag in sorted(versions)
+    ).encode()).hexdigest()
+
+
+def invalidate_tags(*tags):
+    cache.set_many(
+        {TAG_KEY.format(tag): uuid4().hex for tag in set(tags)}, None
+    )
+
+
+def card_tags(post):
+    tags = {
+        post_tag(post.pk), category_tag(post.category_id),
+        user_tag(post.author_id)
+    }
+    if post.location_id:
+        tags.add(location_tag(post.location_id))
+    return tags
+
+
+def post_tags(posts):
+    tags = set()
+    for post in posts:
+        tags |= card_tags(post)
+    return tags
+
+
+def prime_post_cards(posts):
+    posts = list(posts)
+    versions = get_tag_versions(post_tags(posts), create=True)
+    for post in posts:
+        stamp = version_stamp(
+            {tag: versions[tag] for tag in card_tags(post)}
+        )
+        post.card_cache_key = CARD_KEY.format(post.pk, stamp)
+    cards = cache.get_many([post.card_cache_key for post in posts])
+    for post in posts:
+        post.cached_card = cards.get(post.card_cache_key)
+
+
+def set_cached_card(post, html):
+    cache.set(
+        post.card_cache_key, html, settings.BLOG_POST_CARD_CACHE_TIMEOUT
+    )
+
+
+def page_cache_key(request):
+    url = iri_to_uri(request.build_absolute_uri())
+    return PAGE_KEY.format(md5(url.encode()).hexdigest())
+
+
+def get_cached_page(key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if get_tag_versions(entry['tags']) != entry['tags']:
+        return None
+    response = HttpResponse(entry['content'], status=entry['status'])
+    for header, value in entry['headers']:
+        response[header] = value
+    return response
+
+
+def set_cached_page(key, response, versions, timeout=None):
+    if timeout is None:
+        timeout = settings.BLOG_PAGE_CACHE_TIMEOUT
+    if timeout <= 0:
+        return
+    cache.set(key, {
+        'tags': versions,
+        'content': response.content,
+        'status': response.status_code,
+        'headers': list(response.items()),
+    }, timeout)
+
+
+def get_cached_count(scope, tags, compute, get_timeout):
+    key = COUNT_KEY.format(
+        scope, version_stamp(get_tag_versions(tags, create=True))
+    )
+    count = cache.get(key)
+    if count is None:
+        count = compute()
+        timeout = get_timeout()
+        if timeout > 0:
+            cache.set(key, count, timeout)
+    return count
+
+
+def get_cached_validators(tags, get_timeout):
+    stamp = version_stamp(get_tag_versions(tags, create=True))
+    key = VALIDATORS_KEY.format(stamp)
+    last_modified = cache.get(key)
+    if last_modified is None:
+        last_modified = timezone.now().replace(microsecond=0)
+        timeout = get_timeout()
+        if timeout > 0:
+            cache.set(key, last_modified, timeout)
+    return stamp, last_modified
@@ -2,3 +2,6 @@ class Constants:
     MAX_CHAR_FIELD_LENGTH = 256
     MAX_TITLE_LENGTH = 20
     POSTS_LIMIT = 10
+    EXCERPT_WORDS = 10
+    PAGE_WINDOW_ON_EACH_SIDE = 2
+    PAGE_WINDOW_ON_ENDS = 1
@@ -0,0 +1,89 @@
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image
+
+RENDITIONS = {
+    'card': 640,
+    'detail': 960,
+}
+RENDITION_DENSITIES = (1, 2)
+RENDITION_QUALITY = 85
+
+
+def rendition_name(name, width):
+    stem, _ = os.path.splitext(name)
+    return f'{stem}_{width}w.jpg'
+
+
+def rendition_widths(original_width):
+    return sorted({
+        base * density
+        for base in RENDITIONS.values()
+        for density in RENDITION_DENSITIES
+        if base * density < original_width
+    })
+
+
+def make_rendition(image, width):
+    name = rendition_name(image.name, width)
+    if image.storage.exists(name):
+        return name
+    image.open('rb')
+    try:
+        with Image.open(image) as picture:
+            picture = picture.convert('RGB')
+            picture.thumbnail(
+                (width, picture.height), Image.Resampling.LANCZOS
+            )
+            buffer = BytesIO()
+            picture.save(
+                buffer, 'JPEG', quality=RENDITION_QUALITY, optimize=True
+            )
+    finally:
+        image.close()
+    return image.storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def build_renditions(image, original_width):
+    widths = rendition_widths(original_width)
+    for width in widths:
+        make_rendition(image, width)
+    return widths
+
+
+def image_sources(image, kind, original_width, original_height,
+                  renditions=()):
+    base = RENDITIONS[kind]
+    if original_width is None:
+        return {'src': image.url}
+    if original_width <= base:
+        return {
+            'src': image.url,
+            'srcset': '',
+            'width': original_width,
+            'height': original_height,
+        }
+    height = round(original_height * base / original_width)
+    if base not in renditions:
+        return {
+            'src': image.url,
+            'srcset': '',
+            'width': base,
+            'height': height,
+        }
+    candidates = []
+    for density in RENDITION_DENSITIES:
+        width = base * density
+        if width in renditions:
+            url = image.storage.url(rendition_name(image.name, width))
+        else:
+            url = image.url
+        candidates.append(f'{url} {density}x')
+    return {
+        'src': image.storage.url(rendition_name(image.name, base)),
+        'srcset': ', '.join(candidates),
+        'width': base,
+        'height': height,
+    }
@@ -0,0 +1,75 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+import blog.urls
+import pages.urls
+from blog.benchmark import (compare, load_baseline, run_benchmark,
+                            save_baseline)
+
+
+class Command(BaseCommand):
+    help = (
+        'Замеряет задержку, число и время SQL-запросов, время шаблонов и'
+        ' размер ответа всех страниц блога и сравнивает с базовой линией.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument(
+            '--baseline',
+            default=str(settings.BASE_DIR / 'benchmark_baseline.json'),
+            help='Файл базовой линии в формате JSON.'
+        )
+        parser.add_argument(
+            '--save', action='store_true',
+            help='Сохранить результаты как новую базовую линию.'
+        )
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='Допустимый рост p95 и размера ответа (доля).'
+        )
+        parser.add_argument(
+            '--min-delta-ms', type=float, default=2.0,
+            help='Рост p95 меньше этого значения не считается регрессией.'
+        )
+
+    def handle(self, *args, **options):
+        results = run_benchmark(
+            (blog.urls, pages.urls), options['repeat'], options['warmup']
+        )
+        if results is None:
+            raise CommandError(
+                'Нет опубликованных постов: сначала выполните seed_blog.'
+            )
+        self.stdout.write(
+            f'{"страница":<40} {"код":>4} {"p50":>8} {"p95":>8} {"p99":>8}'
+            f' {"SQL":>4} {"SQL мс":>7} {"шабл. мс":>8} {"байт":>8}'
+        )
+        for key, result in results.items():
+            self.stdout.write(
+                f'{key:<40} {result["status"]:>4}'
+                f' {result["p50_ms"]:>8.2f} {result["p95_ms"]:>8.2f}'
+                f' {result["p99_ms"]:>8.2f} {result["queries"]:>4g}'
+                f' {result["sql_ms"]:>7.2f} {result["template_ms"]:>8.2f}'
+                f' {result["bytes"]:>8}'
+            )
+        if options['save']:
+            save_baseline(options['baseline'], results)
+            self.stdout.write(self.style.SUCCESS(
+                f'Базовая линия сохранена: {options["baseline"]}'
+            ))
+            return
+        if not os.path.exists(options['baseline']):
+            return
+        regressions = compare(
+            results, load_baseline(options['baseline']),
+            options['tolerance'], options['min_delta_ms']
+        )
+        if regressions:
+            raise CommandError(
+                'Обнаружены регрессии:\n' + '\n'.join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS('Регрессий нет.'))
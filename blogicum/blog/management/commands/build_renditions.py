@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from blog.images import build_renditions
+from blog.models import Post
+from blog.tasks import record_renditions
+
+
+class Command(BaseCommand):
+    help = 'Создаёт уменьшенные копии изображений публикаций.'
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='').only('image', 'image_meta')
+        built = failed = 0
+        for post in posts.iterator():
+            if not post.image_meta.get('width'):
+                continue
+            try:
+                widths = build_renditions(
+                    post.image, post.image_meta['width']
+                )
+            except OSError as error:
+                failed += 1
+                self.stderr.write(f'{post.image.name}: {error}')
+                continue
+            record_renditions(post, widths)
+            built += len(widths)
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово копий: {built}, ошибок: {failed}'
+        ))
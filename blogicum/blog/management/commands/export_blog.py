@@ -0,0 +1,191 @@
+import csv
+import json
+from contextlib import nullcontext
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from blog.models import Category, Comment, Location, Post, User
+from blog.views import filter_posts
+
+EXPORTS = {
+    'user': (
+        User, 'date_joined',
+        ('username', 'first_name', 'last_name', 'date_joined'),
+    ),
+    'category': (
+        Category, 'created_at',
+        ('title', 'slug', 'description', 'is_published', 'created_at'),
+    ),
+    'location': (
+        Location, 'created_at', ('name', 'is_published', 'created_at'),
+    ),
+    'post': (
+        Post, 'pub_date',
+        ('title', 'text', 'pub_date', 'is_published', 'created_at',
+         'author', 'category', 'location', 'image'),
+    ),
+    'comment': (
+        Comment, 'created_at', ('text', 'post', 'author', 'created_at'),
+    ),
+}
+
+
+def parse_moment(value):
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f'Неверная дата: {value}')
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_watermark(value):
+    name, _, pk = value.rpartition('=')
+    try:
+        return name or None, int(pk)
+    except ValueError:
+        raise CommandError(f'Неверный первичный ключ: {value}')
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково выгружает авторов, категории, местоположения, публикации'
+        ' и комментарии в JSONL или CSV.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*', metavar='model',
+            help=(
+                'Что выгружать: user, category, location, post, comment.'
+                ' Выгружаются только авторы выгружаемых публикаций и'
+                ' комментариев.'
+            )
+        )
+        parser.add_argument(
+            '--format', choices=('jsonl', 'csv'), default='jsonl'
+        )
+        parser.add_argument('--output', help='Файл для записи.')
+        parser.add_argument(
+            '--since', type=parse_moment,
+            help='Начало периода (дата публикации или создания).'
+        )
+        parser.add_argument(
+            '--until', type=parse_moment, help='Конец периода.'
+        )
+        parser.add_argument(
+            '--published', action='store_true',
+            help='Только то, что видно читателям.'
+        )
+        parser.add_argument(
+            '--after-pk', type=parse_watermark, action='append', default=[],
+            metavar='[MODEL=]PK',
+            help=(
+                'Продолжить выгрузку после указанного первичного ключа:'
+                ' post=123 для каждой модели отдельно или просто 123, если'
+                ' выгружается одна модель.'
+            )
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        models = options['models'] or tuple(EXPORTS)
+        unknown = set(models) - set(EXPORTS)
+        if unknown:
+            raise CommandError(f'Неизвестные модели: {", ".join(unknown)}')
+        if options['format'] == 'csv' and len(models) != 1:
+            raise CommandError('Для CSV укажите ровно одну модель.')
+        options['after_pk'] = self.get_watermarks(
+            models, options['after_pk']
+        )
+        output = (
+            open(options['output'], 'w', encoding='utf-8', newline='')
+            if options['output'] else nullcontext(self.stdout)
+        )
+        with output as file:
+            for name in models:
+                exported, last_pk = self.export(name, file, options)
+                self.stderr.write(
+                    f'{EXPORTS[name][0]._meta.label_lower}: выгружено'
+                    f' {exported}, продолжить с --after-pk {name}={last_pk}'
+                )
+
+    def get_watermarks(self, models, watermarks):
+        result = {}
+        for name, pk in watermarks:
+            if name is None:
+                if len(models) != 1:
+                    raise CommandError(
+                        'Укажите модель в --after-pk (например, post=123)'
+                        ' или выгружайте ровно одну модель.'
+                    )
+                name = models[0]
+            if name not in models:
+                raise CommandError(f'Модель {name} не выгружается.')
+            result[name] = pk
+        return result
+
+    def get_queryset(self, name, options):
+        if name == 'user':
+            return self.get_authors(options)
+        model, date_field, _ = EXPORTS[name]
+        queryset = model.objects.filter(
+            pk__gt=options['after_pk'].get(name, 0)
+        )
+        if options['since']:
+            queryset = queryset.filter(
+                **{f'{date_field}__gte': options['since']}
+            )
+        if options['until']:
+            queryset = queryset.filter(
+                **{f'{date_field}__lt': options['until']}
+            )
+        if options['published']:
+            if model is Post:
+                queryset = filter_posts(queryset)
+            elif model is Comment:
+                queryset = queryset.filter(
+                    post__in=filter_posts(Post.objects).values('pk')
+                )
+            else:
+                queryset = queryset.filter(is_published=True)
+        return queryset.order_by('pk')
+
+    def get_authors(self, options):
+        return User.objects.filter(
+            Q(pk__in=self.get_queryset('post', options).values('author'))
+            | Q(pk__in=self.get_queryset('comment', options).values('author')),
+            pk__gt=options['after_pk'].get('user', 0),
+        ).order_by('pk')
+
+    def export(self, name, file, options):
+        model, _, fields = EXPORTS[name]
+        rows = self.get_queryset(name, options).values_list(
+            'pk', *(model._meta.get_field(field).attname for field in fields)
+        ).iterator(chunk_size=options['chunk_size'])
+        label = model._meta.label_lower
+        if options['format'] == 'csv':
+            writer = csv.writer(file)
+            writer.writerow(('pk',) + fields)
+            write = writer.writerow
+        else:
+            def write(row):
+                file.write(json.dumps(
+                    {'model': label, 'pk': row[0],
+                     'fields': dict(zip(fields, row[1:]))},
+                    cls=DjangoJSONEncoder, ensure_ascii=False
+                ) + '\n')
+        exported = last_pk = 0
+        for row in rows:
+            write(row)
+            exported += 1
+            last_pk = row[0]
+        return exported, last_pk
@@ -0,0 +1,183 @@
+import time
+from collections import Counter
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from blog.bulk import (finish_post_load, iter_json_records, keep_timestamps,
+                       reset_sequences)
+from blog.models import Category, Comment, Location, Post, User, make_excerpt
+
+MODELS = {
+    'auth.user': User,
+    'blog.category': Category,
+    'blog.location': Location,
+    'blog.post': Post,
+    'blog.comment': Comment,
+}
+PASSES = (
+    ('auth.user', 'blog.category', 'blog.location'),
+    ('blog.post',),
+    ('blog.comment',),
+)
+# Ключи, по которым записи сопоставляются с уже существующими.
+# Название местоположения не уникально, поэтому местоположения
+# связываются только по pk из файла.
+NATURAL_KEYS = {User: 'username', Category: 'slug'}
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково загружает пользователей, категории, местоположения,'
+        ' публикации и комментарии из JSON (формат dumpdata) или JSONL.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Путь к файлу JSON или JSONL.')
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Количество строк в одном INSERT.'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=10000,
+            help='Количество строк в одной транзакции.'
+        )
+
+    def handle(self, *args, path, batch_size, chunk_size, **options):
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.verbosity = options['verbosity']
+        self.pk_maps = {model: {} for model in MODELS.values()}
+        self.natural_maps = {
+            model: dict(model.objects.values_list(key, 'pk'))
+            for model, key in NATURAL_KEYS.items()
+        }
+        self.next_pks = {
+            model: (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+            for model in MODELS.values()
+        }
+        self.timestamps = {
+            model: [
+                field.attname for field in model._meta.concrete_fields
+                if getattr(field, 'auto_now_add', False)
+            ]
+            for model in MODELS.values()
+        }
+        self.first_post_pk = self.next_pks[Post]
+        self.scopes = set()
+        self.created = Counter()
+        self.skipped = Counter()
+        self.now = timezone.now()
+        self.started = time.monotonic()
+        with keep_timestamps(*MODELS.values()):
+            for labels in PASSES:
+                with open(path, encoding='utf-8') as file:
+                    self.load(
+                        iter_json_records(file), labels,
+                        count_unknown=labels is PASSES[0]
+                    )
+        reset_sequences(*MODELS.values())
+        with transaction.atomic():
+            finish_post_load(
+                Post.objects.filter(pk__gte=self.first_post_pk), self.scopes
+            )
+        self.report()
+
+    def load(self, records, labels, count_unknown):
+        chunk = []
+        for record in records:
+            label = record.get('model', '').lower()
+            if label not in labels:
+                if count_unknown and label not in MODELS:
+                    self.skipped[label] += 1
+                continue
+            obj = self.build(MODELS[label], record)
+            if obj is None:
+                continue
+            chunk.append(obj)
+            if len(chunk) >= self.chunk_size:
+                self.flush(chunk)
+                chunk = []
+        self.flush(chunk)
+
+    def build(self, model, record):
+        fields = record['fields']
+        natural_key = NATURAL_KEYS.get(model)
+        if natural_key and fields.get(natural_key) in self.natural_maps[model]:
+            self.pk_maps[model][record['pk']] = (
+                self.natural_maps[model][fields[natural_key]]
+            )
+            self.skipped[model._meta.label_lower] += 1
+            return None
+        values = self.convert(model, fields)
+        if values is None:
+            self.skipped[model._meta.label_lower] += 1
+            return None
+        for name in self.timestamps[model]:
+            values.setdefault(name, self.now)
+        if model is User:
+            values.setdefault('password', make_password(None))
+        if model is Post:
+            values['excerpt'] = make_excerpt(values.get('text', ''))
+            self.scopes.add((values.get('category_id'), values['author_id']))
+        pk = self.next_pks[model]
+        self.next_pks[model] += 1
+        self.pk_maps[model][record['pk']] = pk
+        if natural_key:
+            self.natural_maps[model][values[natural_key]] = pk
+        return model(pk=pk, **values)
+
+    def convert(self, model, fields):
+        values = {}
+        for name, value in fields.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.many_to_many:
+                continue
+            if field.is_relation:
+                target = self.pk_maps[field.related_model].get(value)
+                if target is None and not field.null:
+                    return None
+                values[field.attname] = target
+            else:
+                values[name] = field.to_python(value)
+        return values
+
+    def flush(self, objs):
+        if not objs:
+            return
+        by_model = {}
+        for obj in objs:
+            by_model.setdefault(type(obj), []).append(obj)
+        with transaction.atomic():
+            for model, model_objs in by_model.items():
+                model.objects.bulk_create(
+                    model_objs, batch_size=self.batch_size
+                )
+                self.created[model._meta.label_lower] += len(model_objs)
+        if self.verbosity > 1:
+            self.stdout.write(
+                f'Загружено строк: {sum(self.created.values())},'
+                f' {self.rate():.0f} строк/с'
+            )
+
+    def rate(self):
+        return sum(self.created.values()) / max(
+            time.monotonic() - self.started, 1e-9
+        )
+
+    def report(self):
+        for label, count in sorted(self.created.items()):
+            self.stdout.write(f'{label}: загружено {count}')
+        for label, count in sorted(self.skipped.items()):
+            self.stdout.write(f'{label}: пропущено {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово за {time.monotonic() - self.started:.1f} с,'
+            f' {self.rate():.0f} строк/с'
+        ))
@@ -0,0 +1,214 @@
+import random
+import time
+from datetime import timedelta
+from itertools import accumulate, islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from faker import Faker
+
+from blog.bulk import finish_post_load, keep_timestamps, reset_sequences
+from blog.models import Category, Comment, Location, Post, User, make_excerpt
+
+VOCABULARY_SIZE = 2000
+
+
+def zipf_weights(count, exponent):
+    return list(accumulate(1 / (rank ** exponent)
+                           for rank in range(1, count + 1)))
+
+
+class Command(BaseCommand):
+    help = (
+        'Генерирует синтетические данные для нагрузочного тестирования:'
+        ' пользователей, категории, местоположения, публикации и'
+        ' комментарии.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=200)
+        parser.add_argument('--posts', type=int, default=100000)
+        parser.add_argument('--comments', type=int, default=300000)
+        parser.add_argument(
+            '--future-fraction', type=float, default=0.05,
+            help='Доля отложенных публикаций.'
+        )
+        parser.add_argument(
+            '--unpublished-fraction', type=float, default=0.05,
+            help='Доля скрытых публикаций, категорий и местоположений.'
+        )
+        parser.add_argument(
+            '--skew', type=float, default=1.1,
+            help='Показатель распределения Ципфа для авторов и комментариев.'
+        )
+        parser.add_argument(
+            '--days', type=int, default=3 * 365,
+            help='За сколько дней распределять даты публикаций.'
+        )
+        parser.add_argument(
+            '--password', help='Пароль всех созданных пользователей.'
+        )
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if options['posts'] and not (
+            options['users'] and options['categories']
+        ):
+            raise CommandError(
+                'Для публикаций нужны хотя бы один пользователь и категория.'
+            )
+        if options['comments'] and not (
+            options['users'] and options['posts']
+        ):
+            raise CommandError(
+                'Для комментариев нужны хотя бы один пользователь и'
+                ' публикация.'
+            )
+        self.options = options
+        self.random = random.Random(options['seed'])
+        faker = Faker('ru_RU')
+        faker.seed_instance(options['seed'])
+        self.vocabulary = faker.words(VOCABULARY_SIZE)
+        self.now = timezone.now()
+        self.created = 0
+        self.started = time.monotonic()
+        self.first_pks = {
+            model: (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+            for model in (User, Category, Location, Post, Comment)
+        }
+        password = make_password(options['password'])
+        with keep_timestamps(Category, Location, Post, Comment):
+            self.insert(User, (
+                User(
+                    pk=pk, username=f'seed{pk}', password=password,
+                    date_joined=self.moment()
+                )
+                for pk in self.pks(User, options['users'])
+            ))
+            self.insert(Category, (
+                Category(
+                    pk=pk, title=self.sentence(1, 3), slug=f'seed-{pk}',
+                    description=self.sentence(5, 20),
+                    is_published=self.published(), created_at=self.moment()
+                )
+                for pk in self.pks(Category, options['categories'])
+            ))
+            self.insert(Location, (
+                Location(
+                    pk=pk, name=self.sentence(1, 2),
+                    is_published=self.published(), created_at=self.moment()
+                )
+                for pk in self.pks(Location, options['locations'])
+            ))
+            comment_counts = self.comment_counts()
+            self.insert(Post, self.posts())
+            self.insert(Comment, self.comments(comment_counts))
+        reset_sequences(User, Category, Location, Post, Comment)
+        with transaction.atomic():
+            finish_post_load(
+                Post.objects.filter(pk__gte=self.first_pks[Post]),
+                self.scopes
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано строк: {self.created} за'
+            f' {time.monotonic() - self.started:.1f} с,'
+            f' {self.rate():.0f} строк/с'
+        ))
+
+    def pks(self, model, count):
+        return range(self.first_pks[model], self.first_pks[model] + count)
+
+    def pick(self, model, count, cum_weights=None):
+        return self.first_pks[model] + self.random.choices(
+            range(count), cum_weights=cum_weights
+        )[0]
+
+    def published(self):
+        return self.random.random() >= self.options['unpublished_fraction']
+
+    def moment(self):
+        return self.now - timedelta(
+            seconds=self.random.randrange(self.options['days'] * 86400 + 1)
+        )
+
+    def sentence(self, min_words, max_words):
+        words = self.random.choices(
+            self.vocabulary, k=self.random.randint(min_words, max_words)
+        )
+        return ' '.join(words).capitalize()
+
+    def comment_counts(self):
+        posts = self.options['posts']
+        counts = [0] * posts
+        if posts:
+            weights = zipf_weights(posts, self.options['skew'])
+            for index in self.random.choices(
+                range(posts), cum_weights=weights, k=self.options['comments']
+            ):
+                counts[index] += 1
+            self.random.shuffle(counts)
+        return counts
+
+    def posts(self):
+        options = self.options
+        author_weights = zipf_weights(options['users'], options['skew'])
+        self.scopes = set()
+        for pk in self.pks(Post, options['posts']):
+            created_at = self.moment()
+            if self.random.random() < options['future_fraction']:
+                pub_date = self.now + timedelta(
+                    minutes=self.random.randrange(1, 30 * 24 * 60)
+                )
+            else:
+                pub_date = created_at
+            text = self.sentence(20, 300)
+            post = Post(
+                pk=pk, title=self.sentence(2, 6), text=text,
+                excerpt=make_excerpt(text), pub_date=pub_date,
+                is_published=self.published(), created_at=created_at,
+                author_id=self.pick(User, options['users'], author_weights),
+                category_id=self.pick(Category, options['categories']),
+                location_id=(
+                    self.pick(Location, options['locations'])
+                    if options['locations'] and self.random.random() < 0.7
+                    else None
+                ),
+            )
+            self.scopes.add((post.category_id, post.author_id))
+            yield post
+
+    def comments(self, comment_counts):
+        pk = self.first_pks[Comment]
+        for post_pk, count in zip(self.pks(Post, len(comment_counts)),
+                                  comment_counts):
+            for _ in range(count):
+                yield Comment(
+                    pk=pk, post_id=post_pk, text=self.sentence(3, 40),
+                    author_id=self.pick(User, self.options['users']),
+                    created_at=self.moment(),
+                )
+                pk += 1
+
+    def insert(self, model, objs):
+        batch_size = self.options['batch_size']
+        while True:
+            batch = list(islice(objs, batch_size))
+            if not batch:
+                return
+            with transaction.atomic():
+                model.objects.bulk_create(batch)
+            self.created += len(batch)
+            if self.options['verbosity'] > 1:
+                self.stdout.write(
+                    f'{model._meta.label_lower}: {self.created} строк,'
+                    f' {self.rate():.0f} строк/с'
+                )
+
+    def rate(self):
+        return self.created / max(time.monotonic() - self.started, 1e-9)
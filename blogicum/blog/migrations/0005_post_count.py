@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-18 03:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_post_excerpt'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=256, unique=True, verbose_name='Область')),
+                ('count', models.PositiveIntegerField(verbose_name='Количество публикаций')),
+            ],
+            options={
+                'verbose_name': 'счётчик публикаций',
+                'verbose_name_plural': 'Счётчики публикаций',
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 3.2.16 on 2026-10-18 03:06
+
+from hashlib import sha256
+
+import blog.models
+from django.core.files.images import get_image_dimensions
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+
+def fill_image_meta(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    posts = Post.objects.exclude(image='').values_list('pk', 'image')
+    for pk, name in posts.iterator():
+        digest = sha256()
+        try:
+            with default_storage.open(name) as file:
+                for chunk in file.chunks():
+                    digest.update(chunk)
+                width, height = get_image_dimensions(file)
+            size = default_storage.size(name)
+        except OSError:
+            continue
+        Post.objects.filter(pk=pk).update(image_meta={
+            'width': width,
+            'height': height,
+            'size': size,
+            'sha256': digest.hexdigest(),
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Параметры изображения'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='image',
+            field=models.ImageField(blank=True, upload_to=blog.models.post_image_path, verbose_name='Изображение'),
+        ),
+        migrations.RunPython(fill_image_meta, migrations.RunPython.noop),
+    ]
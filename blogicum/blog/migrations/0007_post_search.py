@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.db import migrations
+
+CREATE_SQL = (
+    'CREATE VIRTUAL TABLE blog_post_search USING fts5('
+    'title, text, author, category, location,'
+    ' tokenize = \'unicode61 remove_diacritics 2\')'
+)
+
+RANK_SQL = (
+    'INSERT INTO blog_post_search (blog_post_search, rank)'
+    ' VALUES (\'rank\', \'bm25(10.0, 1.0, 2.0, 3.0, 3.0)\')'
+)
+
+FILL_SQL = (
+    'INSERT INTO blog_post_search'
+    ' (rowid, title, text, author, category, location)'
+    ' SELECT post.id, post.title, post.text, author.username,'
+    ' COALESCE(category.title, \'\'), COALESCE(location.name, \'\')'
+    ' FROM blog_post post'
+    ' INNER JOIN auth_user author ON author.id = post.author_id'
+    ' LEFT JOIN blog_category category ON category.id = post.category_id'
+    ' LEFT JOIN blog_location location ON location.id = post.location_id'
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0006_post_image_meta'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [CREATE_SQL, RANK_SQL, FILL_SQL],
+            'DROP TABLE blog_post_search',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-18 03:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_admin_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postcount',
+            name='valid_until',
+            field=models.DateTimeField(blank=True, help_text='Дата ближайшей отложенной публикации, после которой счётчик пересчитывается.', null=True, verbose_name='Действителен до'),
+        ),
+    ]
@@ -1,15 +1,34 @@
+from hashlib import md5
+from math import ceil
+
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db.models import Min
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from django.views.decorators.http import condition
 
+from .cache import (CARDS_TAG, card_tags, get_cached_page,
+                    get_cached_validators, get_tag_versions, page_cache_key,
+                    post_tags, prime_post_cards, set_cached_page)
 from .form import CommentForm, PostForm
 from .models import Comment, Post
+from .paginators import CachedCountPaginator, CursorPaginator, InvalidCursor
+from .utils import request_cached
 
 
 class AuthorPermissionMixin(UserPassesTestMixin):
 
+    @request_cached
+    def get_object(self, queryset=None):
+        return super().get_object(queryset)
+
     def test_func(self):
-        return self.get_object().author == self.request.user
+        return self.get_object().author_id == self.request.user.id
 
 
 class PostMixin(LoginRequiredMixin, AuthorPermissionMixin):
@@ -18,6 +37,9 @@ class PostMixin(LoginRequiredMixin, AuthorPermissionMixin):
     template_name = 'blog/create.html'
     pk_url_kwarg = 'post_id'
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('category', 'location')
+
     def handle_no_permission(self):
         return redirect(
             'blog:post_detail', post_id=self.kwargs.get(self.pk_url_kwarg)
@@ -30,7 +52,8 @@ class PostMixin(LoginRequiredMixin, AuthorPermissionMixin):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = self.form_class(instance=self.get_object())
+        if 'form' not in context:
+            context['form'] = self.form_class(instance=self.object)
         return context
 
 
@@ -44,3 +67,162 @@ class CommentMixin(LoginRequiredMixin):
         return reverse(
             'blog:post_detail', kwargs={'post_id': self.kwargs['post_id']}
         )
+
+
+class CursorPaginationMixin:
+    cursor_pagination = None
+
+    def use_cursor_pagination(self):
+        enabled = self.cursor_pagination
+        if enabled is None:
+            enabled = settings.BLOG_CURSOR_PAGINATION
+        return enabled and self.page_kwarg not in self.request.GET
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get('after'),
+                before=self.request.GET.get('before'),
+            )
+        except InvalidCursor:
+            raise Http404('Неверный курсор страницы.')
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class AnonymousPageCacheMixin:
+    page_cache_key = None
+    page_tag_versions = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if (
+            request.method in ('GET', 'HEAD')
+            and not request.user.is_authenticated
+        ):
+            self.page_cache_key = page_cache_key(request)
+            response = get_cached_page(self.page_cache_key)
+            if response is not None:
+                return get_conditional_response(
+                    request,
+                    etag=response.get('ETag'),
+                    last_modified=parse_http_date_safe(
+                        response.get('Last-Modified', '')
+                    ),
+                    response=response,
+                )
+            self.page_tag_versions = get_tag_versions(
+                self.get_list_tags(), create=True
+            )
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_list_tags(self):
+        return set()
+
+    def get_cache_tags(self, context):
+        return post_tags(context['page_obj']) | self.get_list_tags()
+
+    def get_scheduled_posts(self):
+        return None
+
+    @request_cached
+    def get_next_pub_date(self):
+        scheduled = self.get_scheduled_posts()
+        if scheduled is None:
+            return None
+        return scheduled.aggregate(
+            next_pub_date=Min('pub_date')
+        )['next_pub_date']
+
+    def get_cache_timeout(self, timeout=None):
+        if timeout is None:
+            timeout = settings.BLOG_PAGE_CACHE_TIMEOUT
+        next_pub_date = self.get_next_pub_date()
+        if next_pub_date is not None:
+            timeout = min(timeout, ceil(
+                (next_pub_date - timezone.now()).total_seconds()
+            ))
+        return timeout
+
+    def render_to_response(self, context, **response_kwargs):
+        response = super().render_to_response(context, **response_kwargs)
+        if self.page_cache_key and response.status_code == 200:
+            key = self.page_cache_key
+            versions = {
+                **get_tag_versions(self.get_cache_tags(context), create=True),
+                **self.page_tag_versions,
+            }
+            timeout = self.get_cache_timeout()
+            response.add_post_render_callback(
+                lambda response: set_cached_page(
+                    key, response, versions, timeout
+                )
+            )
+        return response
+
+
+class PostCardsMixin:
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        prime_post_cards(context['page_obj'])
+        return context
+
+
+class CachedCountMixin:
+    paginator_class = CachedCountPaginator
+
+    def get_count_scope(self):
+        return None
+
+    def get_count_timeout(self):
+        return self.get_cache_timeout(settings.BLOG_COUNT_CACHE_TIMEOUT)
+
+    def get_paginator(self, *args, **kwargs):
+        return super().get_paginator(
+            *args,
+            count_scope=self.get_count_scope(),
+            count_tags=self.get_list_tags(),
+            count_timeout=self.get_count_timeout,
+            count_valid_until=self.get_next_pub_date,
+            **kwargs
+        )
+
+
+def make_etag(*parts):
+    return md5(repr(parts).encode()).hexdigest()
+
+
+class ConditionalGetMixin:
+
+    def dispatch(self, request, *args, **kwargs):
+        return condition(
+            etag_func=lambda *args, **kwargs: self.get_validators()[0],
+            last_modified_func=(
+                lambda *args, **kwargs: self.get_validators()[1]
+            ),
+        )(super().dispatch)(request, *args, **kwargs)
+
+    def get_validator_tags(self):
+        return self.get_list_tags() | {CARDS_TAG}
+
+    def get_validators_timeout(self):
+        return self.get_cache_timeout(settings.BLOG_COUNT_CACHE_TIMEOUT)
+
+    @request_cached
+    def get_validators(self):
+        stamp, last_modified = get_cached_validators(
+            self.get_validator_tags(), self.get_validators_timeout
+        )
+        etag = make_etag(
+            self.request.user.pk, stamp, last_modified,
+            sorted(self.request.GET.items()),
+        )
+        return etag, last_modified
+
+
+class PostConditionalGetMixin(ConditionalGetMixin):
+
+    def get_validator_tags(self):
+        return card_tags(self.get_post())
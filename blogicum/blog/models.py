@@ -1,12 +1,38 @@
+import os
+from hashlib import sha256
+
 from django.contrib.auth import get_user_model
+from django.core.files.images import get_image_dimensions
 from django.db import models
 from django.urls import reverse
+from django.utils.text import Truncator
 
 from .constants import Constants
 
 User = get_user_model()
 
 
+def post_image_path(instance, filename):
+    extension = os.path.splitext(filename)[1].lower()
+    return (
+        f'posts_images/{instance.image_meta["sha256"][:2]}/'
+        f'{instance.image_meta["sha256"]}{extension}'
+    )
+
+
+def hash_file(file):
+    digest = sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_excerpt(text):
+    return Truncator(text).words(Constants.EXCERPT_WORDS, truncate=' …')[
+        :Constants.MAX_CHAR_FIELD_LENGTH
+    ]
+
+
 class AbstsractCreatedAt(models.Model):
     created_at = models.DateTimeField('Добавлено', auto_now_add=True)
 
@@ -70,6 +96,10 @@ class Post(AbstractPublishedCreated):
         'Заголовок', max_length=Constants.MAX_CHAR_FIELD_LENGTH
     )
     text = models.TextField('Текст')
+    excerpt = models.CharField(
+        'Анонс', max_length=Constants.MAX_CHAR_FIELD_LENGTH,
+        blank=True, editable=False
+    )
     pub_date = models.DateTimeField(
         'Дата и время публикации',
         help_text=(
@@ -90,17 +120,78 @@ class Post(AbstractPublishedCreated):
         verbose_name='Категория',
     )
     image = models.ImageField(
-        'Изображение', upload_to='posts_images', blank=True
+        'Изображение', upload_to=post_image_path, blank=True
+    )
+    image_meta = models.JSONField(
+        'Параметры изображения', default=dict, blank=True, editable=False
+    )
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев', default=0, editable=False
     )
 
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'post_id': self.pk})
 
+    def save(self, *args, **kwargs):
+        deferred = self.get_deferred_fields()
+        if 'text' not in deferred:
+            self.excerpt = make_excerpt(self.text)
+        if 'image' not in deferred:
+            self.store_image()
+        if (
+            self.pk is not None and not self._state.adding
+            and kwargs.get('update_fields') is None
+        ):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'comment_count'
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+    def store_image(self):
+        if not self.image:
+            self.image_meta = {}
+            return
+        if self.image._committed:
+            return
+        width, height = get_image_dimensions(self.image.file)
+        self.image_meta = {
+            'width': width,
+            'height': height,
+            'size': self.image.size,
+            'sha256': hash_file(self.image),
+        }
+        self.image_uploaded = True
+        name = post_image_path(self, self.image.name)
+        if self.image.storage.exists(name):
+            self.image.name = name
+            self.image._committed = True
+
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
         default_related_name = 'posts'
+        indexes = (
+            models.Index(
+                fields=('pub_date',),
+                name='post_published_pub_date_idx',
+                condition=models.Q(is_published=True),
+            ),
+            models.Index(
+                fields=('category', 'pub_date'),
+                name='post_category_pub_date_idx',
+                condition=models.Q(is_published=True),
+            ),
+            models.Index(
+                fields=('author', 'pub_date'),
+                name='post_author_pub_date_idx',
+            ),
+            models.Index(
+                fields=('created_at',), name='post_created_at_idx'
+            ),
+        )
 
 
 class Comment(AbstsractCreatedAt):
@@ -119,9 +210,39 @@ class Comment(AbstsractCreatedAt):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_idx',
+            ),
+            models.Index(
+                fields=('created_at',), name='comment_created_at_idx'
+            ),
+        )
 
     def __str__(self):
         return (
             (self.text[:Constants.MAX_TITLE_LENGTH] + '...')
             if len(self.text) > Constants.MAX_TITLE_LENGTH else self.text
         )
+
+
+class PostCount(models.Model):
+    scope = models.CharField(
+        'Область', max_length=Constants.MAX_CHAR_FIELD_LENGTH, unique=True
+    )
+    count = models.PositiveIntegerField('Количество публикаций')
+    valid_until = models.DateTimeField(
+        'Действителен до', null=True, blank=True,
+        help_text=(
+            'Дата ближайшей отложенной публикации, после которой счётчик'
+            ' пересчитывается.'
+        )
+    )
+
+    class Meta:
+        verbose_name = 'счётчик публикаций'
+        verbose_name_plural = 'Счётчики публикаций'
+
+    def __str__(self):
+        return f'{self.scope}: {self.count}'
@@ -0,0 +1,173 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+from .cache import get_cached_count
+from .models import PostCount
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(post):
+    raw = json.dumps([post.pub_date.isoformat(), post.pk])
+    return urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        raw = urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        pub_date, pk = json.loads(raw)
+        pub_date = parse_datetime(pub_date)
+        pk = int(pk)
+    except (TypeError, ValueError):
+        raise InvalidCursor(token)
+    if pub_date is None:
+        raise InvalidCursor(token)
+    return pub_date, pk
+
+
+class CursorPage(Sequence):
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f'<Cursor page of {len(self.object_list)} items>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if self._has_next and self.object_list:
+            return encode_cursor(self.object_list[-1])
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self._has_previous and self.object_list:
+            return encode_cursor(self.object_list[0])
+        return None
+
+
+class CursorPaginator:
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+
+    def page(self, after=None, before=None):
+        if before:
+            pub_date, pk = decode_cursor(before)
+            posts = list(
+                self.queryset.filter(
+                    Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, pk__gt=pk)
+                ).order_by('pub_date', 'pk')[:self.per_page + 1]
+            )
+            has_previous = len(posts) > self.per_page
+            posts = posts[:self.per_page][::-1]
+            return CursorPage(posts, self, bool(posts), has_previous)
+        queryset = self.queryset.order_by('-pub_date', '-pk')
+        if after:
+            pub_date, pk = decode_cursor(after)
+            queryset = queryset.filter(
+                Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, pk__lt=pk)
+            )
+        posts = list(queryset[:self.per_page + 1])
+        return CursorPage(
+            posts[:self.per_page], self,
+            len(posts) > self.per_page, bool(after and posts)
+        )
+
+
+def get_counter(scope, compute, get_valid_until):
+    counter = PostCount.objects.filter(scope=scope).values_list(
+        'count', 'valid_until'
+    ).first()
+    if counter is not None:
+        count, valid_until = counter
+        if valid_until is None or valid_until > timezone.now():
+            return count
+    count = compute()
+    PostCount.objects.update_or_create(
+        scope=scope,
+        defaults={'count': count, 'valid_until': get_valid_until()}
+    )
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    def __init__(self, *args, count_scope=None, count_tags=(),
+                 count_timeout=None, count_valid_until=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_scope = count_scope
+        self.count_tags = count_tags
+        self.count_timeout = count_timeout
+        self.count_valid_until = count_valid_until or (lambda: None)
+
+    def count_objects(self):
+        return self.object_list.count()
+
+    @cached_property
+    def count(self):
+        if self.count_scope is None:
+            return self.count_objects()
+        if settings.BLOG_APPROXIMATE_COUNTS:
+            return get_counter(
+                self.count_scope, self.count_objects, self.count_valid_until
+            )
+        return get_cached_count(
+            self.count_scope, self.count_tags,
+            self.count_objects, self.count_timeout
+        )
+
+
+def estimate_rows(model):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        )
+        if cursor.fetchone() is None:
+            return None
+        cursor.execute(
+            'SELECT stat FROM sqlite_stat1 WHERE tbl = %s',
+            [model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    return int(row[0].split()[0]) if row else None
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        limit = settings.BLOG_ADMIN_COUNT_LIMIT
+        if not self.object_list.query.where:
+            estimate = estimate_rows(self.object_list.model)
+            if estimate is not None and estimate >= limit:
+                return estimate
+        return self.object_list[:limit].count()
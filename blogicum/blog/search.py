@@ -0,0 +1,64 @@
+import re
+
+from django.db import connection
+from django.db.models import Value
+from django.db.models.expressions import RawSQL
+
+from .models import Category, Location, Post, User
+
+SEARCH_TABLE = 'blog_post_search'
+
+INDEX_SQL = (
+    f'INSERT INTO {SEARCH_TABLE}'
+    ' (rowid, title, text, author, category, location)'
+    ' SELECT post.id, post.title, post.text, author.username,'
+    ' COALESCE(category.title, \'\'), COALESCE(location.name, \'\')'
+    f' FROM {Post._meta.db_table} post'
+    f' INNER JOIN {User._meta.db_table} author'
+    ' ON author.id = post.author_id'
+    f' LEFT JOIN {Category._meta.db_table} category'
+    ' ON category.id = post.category_id'
+    f' LEFT JOIN {Location._meta.db_table} location'
+    ' ON location.id = post.location_id'
+)
+
+
+def match_expression(query):
+    return ' '.join(
+        '"{}"*'.format(word) for word in re.findall(r'\w+', query)
+    )
+
+
+def index_posts(queryset):
+    pks_sql, params = queryset.values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({pks_sql})', params
+        )
+        cursor.execute(f'{INDEX_SQL} WHERE post.id IN ({pks_sql})', params)
+
+
+def unindex_post(pk):
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [pk])
+
+
+def rebuild_index():
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.execute(INDEX_SQL)
+
+
+def search_posts(queryset, query):
+    match = match_expression(query)
+    if not match:
+        return queryset.annotate(search_rank=Value(0.0)).none()
+    return queryset.filter(pk__in=RawSQL(
+        f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s',
+        [match]
+    )).annotate(search_rank=RawSQL(
+        f'SELECT rank FROM {SEARCH_TABLE}'
+        f' WHERE {SEARCH_TABLE} MATCH %s'
+        f' AND rowid = {Post._meta.db_table}.id',
+        [match]
+    ))
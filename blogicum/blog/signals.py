@@ -0,0 +1,180 @@
+from threading import local
+
+from django.db.models import F
+from django.db.models.signals import (post_delete, post_save, pre_delete,
+                                      pre_save)
+from django.dispatch import Signal, receiver
+
+from .cache import (CARDS_TAG, CATEGORIES_TAG, FEED_TAG, author_tag,
+                    category_scope, category_tag, feed_scope, invalidate_tags,
+                    location_tag, post_tag, profile_scope, user_tag)
+from .models import Category, Comment, Location, Post, PostCount, User
+from .search import index_posts, unindex_post
+from .tasks import build_post_renditions
+
+bulk_updated = Signal()
+
+deleting_posts = local()
+
+
+def is_post_deleted(post_id):
+    return post_id in getattr(deleting_posts, 'pks', ())
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post(sender, instance, **kwargs):
+    if not hasattr(deleting_posts, 'pks'):
+        deleting_posts.pks = set()
+    deleting_posts.pks.add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def forget_deleted_post(sender, instance, **kwargs):
+    getattr(deleting_posts, 'pks', set()).discard(instance.pk)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, **kwargs):
+    instance.previous_post_id = None
+    if instance.pk is not None and not instance._state.adding:
+        instance.previous_post_id = Comment.objects.filter(
+            pk=instance.pk
+        ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def update_comment_count(sender, instance, created, **kwargs):
+    previous_post_id = getattr(instance, 'previous_post_id', None)
+    moved = previous_post_id not in (None, instance.post_id)
+    if created or moved:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+    if moved:
+        Post.objects.filter(pk=previous_post_id, comment_count__gt=0).update(
+            comment_count=F('comment_count') - 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    if is_post_deleted(instance.post_id):
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_scope(sender, instance, **kwargs):
+    instance.previous_scope = Post.objects.filter(pk=instance.pk).values_list(
+        'category_id', 'author_id'
+    ).first()
+
+
+def invalidate_post_scopes(pks, scopes):
+    tags = {post_tag(pk) for pk in pks} | {FEED_TAG}
+    counters = {feed_scope()}
+    for category_id, author_id in scopes:
+        tags |= {category_tag(category_id), author_tag(author_id)}
+        counters |= {
+            category_scope(category_id),
+            profile_scope(author_id), profile_scope(author_id, own=True)
+        }
+    invalidate_tags(*tags)
+    PostCount.objects.filter(scope__in=counters).delete()
+
+
+@receiver((post_save, post_delete), sender=Post)
+def invalidate_post_pages(sender, instance, **kwargs):
+    scopes = {(instance.category_id, instance.author_id)}
+    previous_scope = getattr(instance, 'previous_scope', None)
+    if previous_scope:
+        scopes.add(previous_scope)
+    invalidate_post_scopes({instance.pk}, scopes)
+
+
+@receiver(bulk_updated, sender=Post)
+def invalidate_bulk_post_pages(sender, pks, scopes, values, **kwargs):
+    if 'category' in values:
+        scopes = scopes | {
+            (values['category'].pk, author_id) for _, author_id in scopes
+        }
+        index_posts(Post.objects.filter(pk__in=pks))
+    invalidate_post_scopes(pks, scopes)
+
+
+@receiver((post_save, post_delete), sender=Comment)
+def invalidate_comment_pages(sender, instance, **kwargs):
+    if is_post_deleted(instance.post_id):
+        return
+    tags = {post_tag(instance.post_id), CARDS_TAG}
+    previous_post_id = getattr(instance, 'previous_post_id', None)
+    if previous_post_id is not None:
+        tags.add(post_tag(previous_post_id))
+    invalidate_tags(*tags)
+
+
+@receiver((post_save, post_delete), sender=Category)
+def invalidate_category_pages(sender, instance, **kwargs):
+    invalidate_tags(category_tag(instance.pk), CATEGORIES_TAG)
+    PostCount.objects.all().delete()
+
+
+@receiver(bulk_updated, sender=Category)
+def invalidate_bulk_category_pages(sender, pks, **kwargs):
+    invalidate_tags(*(category_tag(pk) for pk in pks), CATEGORIES_TAG)
+    PostCount.objects.all().delete()
+
+
+@receiver((post_save, post_delete), sender=Location)
+def invalidate_location_pages(sender, instance, **kwargs):
+    invalidate_tags(location_tag(instance.pk), CARDS_TAG)
+
+
+@receiver(bulk_updated, sender=Location)
+def invalidate_bulk_location_pages(sender, pks, **kwargs):
+    invalidate_tags(*(location_tag(pk) for pk in pks), CARDS_TAG)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_pages(sender, instance, update_fields, **kwargs):
+    if update_fields and 'username' not in update_fields:
+        return
+    invalidate_tags(user_tag(instance.pk), CARDS_TAG)
+
+
+@receiver(post_save, sender=Post)
+def build_post_image_renditions(sender, instance, **kwargs):
+    if getattr(instance, 'image_uploaded', False):
+        instance.image_uploaded = False
+        build_post_renditions.delay(instance.pk)
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    index_posts(Post.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Post)
+def unindex_deleted_post(sender, instance, **kwargs):
+    unindex_post(instance.pk)
+
+
+@receiver(post_save, sender=Category)
+def reindex_category_posts(sender, instance, created, **kwargs):
+    if not created:
+        index_posts(Post.objects.filter(category=instance))
+
+
+@receiver(post_save, sender=Location)
+def reindex_location_posts(sender, instance, created, **kwargs):
+    if not created:
+        index_posts(Post.objects.filter(location=instance))
+
+
+@receiver(post_save, sender=User)
+def reindex_author_posts(sender, instance, created, update_fields, **kwargs):
+    if created or update_fields and 'username' not in update_fields:
+        return
+    index_posts(Post.objects.filter(author=instance))
@@ -0,0 +1,22 @@
+from tasks.registry import task
+
+from .cache import invalidate_tags, post_tag
+from .images import build_renditions
+from .models import Post
+
+
+def record_renditions(post, widths):
+    post.image_meta = {**post.image_meta, 'renditions': widths}
+    Post.objects.filter(pk=post.pk, image=post.image.name).update(
+        image_meta=post.image_meta
+    )
+    invalidate_tags(post_tag(post.pk))
+
+
+@task
+def build_post_renditions(post_id):
+    post = Post.objects.filter(pk=post_id).only('image', 'image_meta').first()
+    if post is not None and post.image and post.image_meta.get('width'):
+        record_renditions(
+            post, build_renditions(post.image, post.image_meta['width'])
+        )
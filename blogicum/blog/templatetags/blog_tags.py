@@ -0,0 +1,42 @@
+from django import template
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from blog.cache import prime_post_cards, set_cached_card
+from blog.constants import Constants
+from blog.images import image_sources
+
+register = template.Library()
+
+
+@register.simple_tag
+def post_card(post):
+    if not hasattr(post, 'card_cache_key'):
+        prime_post_cards([post])
+    if post.cached_card is None:
+        post.cached_card = render_to_string(
+            'includes/post_card.html', {'post': post}
+        )
+        set_cached_card(post, post.cached_card)
+    return mark_safe(post.cached_card)
+
+
+@register.simple_tag
+def page_window(page_obj):
+    return page_obj.paginator.get_elided_page_range(
+        page_obj.number,
+        on_each_side=Constants.PAGE_WINDOW_ON_EACH_SIDE,
+        on_ends=Constants.PAGE_WINDOW_ON_ENDS,
+    )
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post, kind):
+    return {
+        'post': post,
+        **image_sources(
+            post.image, kind,
+            post.image_meta.get('width'), post.image_meta.get('height'),
+            post.image_meta.get('renditions', ()),
+        ),
+    }
@@ -17,6 +17,10 @@ urlpatterns = [
         'profile/<str:username>/',
         views.ProfileListView.as_view(), name='profile'
     ),
+    path(
+        'search/',
+        views.SearchView.as_view(), name='search'
+    ),
     path(
         'edit_profile/',
         views.ProfileUpdateView.as_view(), name='edit_profile'
@@ -0,0 +1,18 @@
+from functools import wraps
+
+
+def request_cached(method):
+    """Кэширует результат метода представления на время одного запроса.
+
+    Экземпляр представления создаётся заново для каждого запроса, поэтому
+    результат хранится в самом экземпляре и разделяется между
+    get_queryset(), get_context_data() и проверками доступа.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.__dict__.setdefault('_request_cache', {})
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+        return cache[key]
+    return wrapper
@@ -1,22 +1,29 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import urlencode
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 
+from .cache import (CATEGORIES_TAG, FEED_TAG, author_tag, card_tags,
+                    category_scope, category_tag, feed_scope, post_tag,
+                    profile_scope, user_tag)
 from .constants import Constants
 from .form import CommentForm, PostForm, UserForm
-from .mixins import AuthorPermissionMixin, CommentMixin, PostMixin
+from .mixins import (AnonymousPageCacheMixin, AuthorPermissionMixin,
+                     CachedCountMixin, CommentMixin, ConditionalGetMixin,
+                     CursorPaginationMixin, PostCardsMixin,
+                     PostConditionalGetMixin, PostMixin)
 from .models import Category, Comment, Post, User
+from .search import search_posts
+from .utils import request_cached
 
 
 def annotate_posts(queryset):
-    return (
-        queryset.annotate(comment_count=Count('comments'))
-        .select_related('author', 'location', 'category')
-        .prefetch_related('comments')
-    ).order_by('-pub_date')
+    return queryset.select_related(
+        'author', 'location', 'category'
+    ).defer('text').order_by('-pub_date', '-pk')
 
 
 def filter_posts(queryset):
@@ -27,7 +34,25 @@ def filter_posts(queryset):
     )
 
 
-class PageListView(ListView):
+def scheduled_posts(queryset):
+    return queryset.filter(
+        pub_date__gt=timezone.now(),
+        is_published=True,
+        category__is_published=True
+    )
+
+
+def is_post_visible(post):
+    return (
+        post.is_published and post.pub_date <= timezone.now()
+        and post.category is not None and post.category.is_published
+    )
+
+
+class PageListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, CachedCountMixin,
+    CursorPaginationMixin, PostCardsMixin, ListView
+):
     template_name = 'blog/index.html'
     model = Post
     paginate_by = Constants.POSTS_LIMIT
@@ -35,12 +60,25 @@ class PageListView(ListView):
     def get_queryset(self):
         return annotate_posts(filter_posts(Post.objects))
 
+    def get_list_tags(self):
+        return {FEED_TAG, CATEGORIES_TAG}
+
+    def get_count_scope(self):
+        return feed_scope()
+
+    def get_scheduled_posts(self):
+        return scheduled_posts(Post.objects)
+
 
-class CategoryPostListView(ListView):
+class CategoryPostListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, CachedCountMixin,
+    CursorPaginationMixin, PostCardsMixin, ListView
+):
     template_name = 'blog/category.html'
     model = Post
     paginate_by = Constants.POSTS_LIMIT
 
+    @request_cached
     def get_category(self):
         return get_object_or_404(
             Category, slug=self.kwargs.get('category_slug'),
@@ -50,18 +88,31 @@ class CategoryPostListView(ListView):
     def get_queryset(self):
         return annotate_posts(filter_posts(self.get_category().posts))
 
+    def get_list_tags(self):
+        return {category_tag(self.get_category().pk)}
+
+    def get_count_scope(self):
+        return category_scope(self.get_category().pk)
+
+    def get_scheduled_posts(self):
+        return scheduled_posts(self.get_category().posts)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['category'] = self.get_category()
         return context
 
 
-class ProfileListView(ListView):
+class ProfileListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, CachedCountMixin,
+    CursorPaginationMixin, PostCardsMixin, ListView
+):
     model = User
     template_name = 'blog/profile.html'
     context_object_name = 'profile'
     paginate_by = Constants.POSTS_LIMIT
 
+    @request_cached
     def get_author(self):
         return get_object_or_404(User, username=self.kwargs.get('username'))
 
@@ -72,12 +123,43 @@ class ProfileListView(ListView):
             posts = filter_posts(posts)
         return posts
 
+    def get_list_tags(self):
+        return {author_tag(self.get_author().pk), CATEGORIES_TAG}
+
+    def get_count_scope(self):
+        author = self.get_author()
+        return profile_scope(author.pk, own=self.request.user == author)
+
+    def get_scheduled_posts(self):
+        return scheduled_posts(self.get_author().posts)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['profile'] = self.get_author()
         return context
 
 
+class SearchView(PostCardsMixin, ListView):
+    template_name = 'blog/search.html'
+    model = Post
+    paginate_by = Constants.POSTS_LIMIT
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        return annotate_posts(
+            search_posts(filter_posts(Post.objects), self.get_search_query())
+        ).order_by('search_rank', '-pub_date', '-pk')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.get_search_query()
+        context['query'] = query
+        context['page_query'] = urlencode({'q': query}) + '&'
+        return context
+
+
 class ProfileUpdateView(LoginRequiredMixin, UpdateView):
     form_class = UserForm
     template_name = 'blog/user.html'
@@ -91,27 +173,36 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         )
 
 
-class PostListView(ListView):
+class PostListView(
+    AnonymousPageCacheMixin, PostConditionalGetMixin, ListView
+):
     model = Comment
     template_name = 'blog/detail.html'
     context_object_name = 'page_obj'
     paginate_by = Constants.POSTS_LIMIT
     pk_url_kwarg = 'post_id'
 
+    @request_cached
     def get_post(self):
         post = get_object_or_404(
             Post.objects.select_related('author', 'category', 'location'),
             pk=self.kwargs[self.pk_url_kwarg]
         )
-        if post.author == self.request.user:
-            return post
-        return get_object_or_404(
-            filter_posts(Post.objects),
-            pk=self.kwargs[self.pk_url_kwarg])
+        if post.author != self.request.user and not is_post_visible(post):
+            raise Http404('Публикация не найдена.')
+        return post
 
     def get_queryset(self):
         return self.get_post().comments.select_related('author')
 
+    def get_list_tags(self):
+        return {post_tag(self.kwargs[self.pk_url_kwarg])}
+
+    def get_cache_tags(self, context):
+        return card_tags(self.get_post()) | {
+            user_tag(comment.author_id) for comment in context['page_obj']
+        }
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['post'] = self.get_post()
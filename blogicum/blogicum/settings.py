@@ -18,11 +18,12 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'blog.apps.BlogConfig',
     'pages.apps.PagesConfig',
-    'debug_toolbar',
+    'tasks.apps.TasksConfig',
     'django_bootstrap5',
 ]
 
 MIDDLEWARE = [
+    'blogicum.timing.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -30,9 +31,12 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
+if DEBUG:
+    INSTALLED_APPS += ['debug_toolbar']
+    MIDDLEWARE += ['debug_toolbar.middleware.DebugToolbarMiddleware']
+
 ROOT_URLCONF = 'blogicum.urls'
 
 TEMPLATES_DIR = BASE_DIR / 'templates'
@@ -55,6 +59,19 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
+# Версии тегов сбрасываются сигналами в любом процессе (веб-сервер,
+# run_tasks, import_blog, seed_blog), поэтому кэш должен быть общим для
+# всех процессов: LocMemCache здесь не подходит.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+        },
+    }
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -107,6 +124,28 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 CSRF_FAILURE_VIEW = 'pages.views.handler403csrf'
 
-EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+EMAIL_BACKEND = 'tasks.mail.QueuedEmailBackend'
+
+EMAIL_QUEUE_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+
+EMAIL_QUEUE_BATCH_SIZE = 50
+
+EMAIL_QUEUE_FLUSH_INTERVAL = 0.5
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+
+BLOG_CURSOR_PAGINATION = False
+
+BLOG_PAGE_CACHE_TIMEOUT = 60 * 15
+
+BLOG_POST_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+BLOG_COUNT_CACHE_TIMEOUT = 60 * 60
+
+BLOG_APPROXIMATE_COUNTS = False
+
+BLOG_ADMIN_COUNT_LIMIT = 10000
+
+REQUEST_TIMING_SAMPLE_RATE = 1.0 if DEBUG else 0.1
+
+TASKS_ALWAYS_EAGER = False
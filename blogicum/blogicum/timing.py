@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.template.base import Template
+
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+local = threading.local()
+
+
+class Timings:
+    def __init__(self):
+        self.queries = 0
+        self.sql = 0.0
+        self.template = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql += time.perf_counter() - started
+
+
+def install_template_timer():
+    if getattr(Template._render, 'is_timed', False):
+        return
+    original_render = Template._render
+
+    def timed_render(template, context):
+        if not getattr(local, 'active', None):
+            return original_render(template, context)
+        local.depth += 1
+        started = time.perf_counter()
+        try:
+            return original_render(template, context)
+        finally:
+            local.depth -= 1
+            if not local.depth:
+                elapsed = time.perf_counter() - started
+                for timings in local.active:
+                    timings.template += elapsed
+
+    timed_render.is_timed = True
+    Template._render = timed_render
+
+
+@contextmanager
+def collect_timings():
+    install_template_timer()
+    timings = Timings()
+    if not getattr(local, 'active', None):
+        local.active, local.depth = [], 0
+    local.active.append(timings)
+    try:
+        with connection.execute_wrapper(timings):
+            yield timings
+    finally:
+        local.active.remove(timings)
+
+
+class Histograms:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, duration_ms, timings, size):
+        with self.lock:
+            stats = self.views.get(view_name)
+            if stats is None:
+                stats = self.views[view_name] = {
+                    'buckets': [0] * (len(BUCKETS_MS) + 1),
+                    'count': 0, 'total_ms': 0.0, 'sql_ms': 0.0,
+                    'template_ms': 0.0, 'queries': 0, 'bytes': 0,
+                }
+            stats['buckets'][bisect_left(BUCKETS_MS, duration_ms)] += 1
+            stats['count'] += 1
+            stats['total_ms'] += duration_ms
+            stats['sql_ms'] += timings.sql * 1000
+            stats['template_ms'] += timings.template * 1000
+            stats['queries'] += timings.queries
+            stats['bytes'] += size or 0
+
+    def snapshot(self):
+        with self.lock:
+            views = {
+                name: {**stats, 'buckets': list(stats['buckets'])}
+                for name, stats in self.views.items()
+            }
+        for stats in views.values():
+            for name, fraction in (('p50_ms', 0.5), ('p95_ms', 0.95),
+                                   ('p99_ms', 0.99)):
+                stats[name] = bucket_percentile(stats['buckets'], fraction)
+        return views
+
+    def reset(self):
+        with self.lock:
+            self.views.clear()
+
+
+def bucket_percentile(buckets, fraction):
+    threshold = fraction * sum(buckets)
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if count and seen >= threshold:
+            return (
+                BUCKETS_MS[index] if index < len(BUCKETS_MS)
+                else float('inf')
+            )
+    return None
+
+
+histograms = Histograms()
+
+
+def server_timing(duration_ms, timings):
+    return (
+        f'total;dur={duration_ms:.1f}, '
+        f'sql;dur={timings.sql * 1000:.1f};desc="{timings.queries} queries", '
+        f'tpl;dur={timings.template * 1000:.1f}'
+    )
+
+
+class TimingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        if not self.sample_rate:
+            raise MiddlewareNotUsed
+        install_template_timer()
+
+    def __call__(self, request):
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return self.get_response(request)
+        started = time.perf_counter()
+        with collect_timings() as timings:
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - started) * 1000
+        response['Server-Timing'] = server_timing(duration_ms, timings)
+        match = request.resolver_match
+        histograms.record(
+            match.view_name if match else '-', duration_ms, timings,
+            None if response.streaming else len(response.content)
+        )
+        return response
@@ -0,0 +1,120 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+logger = logging.getLogger(__name__)
+
+
+class MailQueue:
+    def __init__(self, backend=None, batch_size=None, flush_interval=None):
+        self.backend = backend
+        self.batch_size = batch_size or settings.EMAIL_QUEUE_BATCH_SIZE
+        self.flush_interval = (
+            settings.EMAIL_QUEUE_FLUSH_INTERVAL
+            if flush_interval is None else flush_interval
+        )
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.counters = {
+            'sent': 0, 'failed': 0, 'batches': 0,
+            'total_latency': 0.0, 'max_latency': 0.0,
+        }
+
+    def put(self, email_messages):
+        queued_at = time.monotonic()
+        for message in email_messages:
+            self.queue.put((queued_at, message))
+        self.start()
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(
+                target=self.run, name='mail-queue', daemon=True
+            )
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.deliver(self.next_batch())
+
+    def next_batch(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def deliver(self, batch):
+        try:
+            connection = get_connection(
+                self.backend or settings.EMAIL_QUEUE_BACKEND
+            )
+            sent = connection.send_messages(
+                [message for _, message in batch]
+            ) or 0
+        except Exception:
+            logger.exception('Не удалось отправить %d писем', len(batch))
+            sent = 0
+        delivered_at = time.monotonic()
+        with self.lock:
+            self.counters['sent'] += sent
+            self.counters['failed'] += len(batch) - sent
+            self.counters['batches'] += 1
+            for queued_at, _ in batch:
+                latency = delivered_at - queued_at
+                self.counters['total_latency'] += latency
+                self.counters['max_latency'] = max(
+                    self.counters['max_latency'], latency
+                )
+        for _ in batch:
+            self.queue.task_done()
+
+    def flush(self):
+        if self.thread is not None:
+            self.queue.join()
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+        delivered = stats['sent'] + stats['failed']
+        stats['depth'] = self.queue.qsize()
+        stats['avg_latency'] = (
+            stats.pop('total_latency') / delivered if delivered else 0.0
+        )
+        return stats
+
+
+mail_queue = None
+mail_queue_lock = threading.Lock()
+
+
+def get_mail_queue():
+    global mail_queue
+    with mail_queue_lock:
+        if mail_queue is None:
+            mail_queue = MailQueue()
+            atexit.register(mail_queue.flush)
+    return mail_queue
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        get_mail_queue().put(email_messages)
+        return len(email_messages)
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import Task
+from tasks.worker import Worker
+
+
+class Command(BaseCommand):
+    help = 'Запускает обработчик фоновых задач.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=4,
+            help='Количество потоков-обработчиков.'
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=1.0,
+            help='Пауза между проверками очереди, в секундах.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить готовые задачи и завершиться.'
+        )
+        parser.add_argument(
+            '--requeue', action='store_true',
+            help='Вернуть в очередь задачи, прерванные остановкой обработчика.'
+        )
+
+    def handle(self, *args, **options):
+        if options['requeue']:
+            requeued = Task.objects.filter(status=Task.RUNNING).update(
+                status=Task.PENDING
+            )
+            self.stdout.write(f'Возвращено в очередь: {requeued}')
+        worker = Worker(options['threads'], options['poll_interval'])
+        try:
+            if options['once']:
+                total_done = total_failed = 0
+                while True:
+                    done, failed = worker.run_once()
+                    if not done and not failed:
+                        break
+                    total_done += done
+                    total_failed += failed
+                self.stdout.write(self.style.SUCCESS(
+                    f'Выполнено: {total_done}, с ошибкой: {total_failed}'
+                ))
+            else:
+                worker.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            worker.shutdown()
@@ -0,0 +1,38 @@
+from functools import update_wrapper
+
+from django.conf import settings
+from django.db import transaction
+
+registry = {}
+
+
+class TaskFunction:
+    def __init__(self, func, max_attempts, retry_delay):
+        update_wrapper(self, func)
+        self.func = func
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        if settings.TASKS_ALWAYS_EAGER:
+            transaction.on_commit(lambda: self.func(*args, **kwargs))
+            return None
+        from .models import Task
+        return Task.objects.create(
+            name=self.name, args=list(args), kwargs=kwargs,
+            max_attempts=self.max_attempts,
+        )
+
+
+def task(func=None, *, max_attempts=3, retry_delay=10):
+    def register(func):
+        task_function = TaskFunction(func, max_attempts, retry_delay)
+        registry[task_function.name] = task_function
+        return task_function
+    if func is not None:
+        return register(func)
+    return register
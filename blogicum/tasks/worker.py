@@ -0,0 +1,71 @@
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+from .registry import registry
+
+
+def claim_tasks(limit):
+    pks = Task.objects.filter(
+        status=Task.PENDING, run_at__lte=timezone.now()
+    ).values_list('pk', flat=True)[:limit]
+    return [
+        pk for pk in list(pks)
+        if Task.objects.filter(pk=pk, status=Task.PENDING).update(
+            status=Task.RUNNING, attempts=F('attempts') + 1
+        )
+    ]
+
+
+def execute_task(pk):
+    try:
+        task = Task.objects.get(pk=pk)
+        try:
+            registry[task.name](*task.args, **task.kwargs)
+        except Exception:
+            retry_task(task, traceback.format_exc())
+            return False
+        task.delete()
+        return True
+    finally:
+        connection.close()
+
+
+def retry_task(task, error):
+    task.last_error = error
+    task_function = registry.get(task.name)
+    if task_function is None or task.attempts >= task.max_attempts:
+        task.status = Task.FAILED
+    else:
+        task.status = Task.PENDING
+        task.run_at = timezone.now() + timedelta(
+            seconds=task_function.retry_delay * 2 ** (task.attempts - 1)
+        )
+    task.save(update_fields=('status', 'run_at', 'last_error'))
+
+
+class Worker:
+    def __init__(self, threads=4, poll_interval=1.0):
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+
+    def run_once(self):
+        pks = claim_tasks(self.threads * 2)
+        results = list(self.executor.map(execute_task, pks))
+        return results.count(True), results.count(False)
+
+    def run_forever(self):
+        while True:
+            done, failed = self.run_once()
+            if not done and not failed:
+                time.sleep(self.poll_interval)
+
+    def shutdown(self):
+        self.executor.shutdown()
@@ -0,0 +1,100 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+# Максимум SQL-запросов на страницу: (аноним, автор).
+# Кеш очищается перед каждым запросом, поэтому это холодный путь.
+QUERY_BUDGETS = {
+    'blog:index': (5, 6),
+    'blog:category_posts': (6, 7),
+    'blog:profile': (6, 7),
+    'blog:search': (2, 4),
+    'blog:edit_profile': (0, 2),
+    'blog:post_detail': (4, 6),
+    'blog:create_post': (0, 4),
+    'blog:edit_post': (0, 5),
+    'blog:delete_post': (0, 3),
+    'blog:add_comment': (0, 2),
+    'blog:edit_comment': (0, 3),
+    'blog:delete_comment': (0, 3),
+    'pages:about': (0, 2),
+    'pages:rules': (0, 2),
+}
+# Страницы, с которых анонимного пользователя перенаправляют на вход.
+LOGIN_REQUIRED = {
+    'blog:edit_profile', 'blog:create_post', 'blog:edit_post',
+    'blog:delete_post', 'blog:add_comment', 'blog:edit_comment',
+    'blog:delete_comment',
+}
+DATA_SIZES = (1, 10, 100)
+
+
+class GrowingBlog:
+    def __init__(self, mixer, author, category, location):
+        self.mixer = mixer
+        self.author = author
+        self.category = category
+        self.location = location
+        self.posts = []
+        self.comments = []
+        self.own_comment = None
+
+    def grow(self, size):
+        self.posts += self.mixer.cycle(size - len(self.posts)).blend(
+            'blog.Post', author=self.author, category=self.category,
+            location=self.location, is_published=True,
+            title=self.mixer.sequence('Заметка {0}'),
+        )
+        new_comments = size - len(self.comments)
+        commenters = self.mixer.cycle(new_comments).blend('auth.User')
+        self.comments += self.mixer.cycle(new_comments).blend(
+            'blog.Comment', post=self.posts[0],
+            author=(commenter for commenter in commenters),
+        )
+        if self.own_comment is None:
+            self.own_comment = self.mixer.blend(
+                'blog.Comment', post=self.posts[0], author=self.author
+            )
+
+    @property
+    def url_kwargs(self):
+        return {
+            'post_id': self.posts[0].pk,
+            'comment_id': self.own_comment.pk,
+            'category_slug': self.category.slug,
+            'username': self.author.username,
+        }
+
+
+@pytest.fixture
+def growing_blog(mixer: Mixer, user, published_category, published_location):
+    return GrowingBlog(mixer, user, published_category, published_location)
+
+
+@pytest.fixture
+def assert_query_budget():
+    def check(client, url_name, get_url, grow, budget, status):
+        counts = {}
+        for size in DATA_SIZES:
+            grow(size)
+            url = get_url()
+            cache.clear()
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+            assert response.status_code == status, (
+                f"Страница `{url_name}` вернула код"
+                f" {response.status_code} вместо {status}; бюджет"
+                " SQL-запросов проверяется только для ожидаемого ответа."
+            )
+            counts[size] = len(context)
+        assert len(set(counts.values())) == 1, (
+            f"Число SQL-запросов страницы `{url_name}` растёт вместе с"
+            f" объёмом данных (N+1): {counts}."
+        )
+        assert counts[DATA_SIZES[-1]] <= budget, (
+            f"Страница `{url_name}` выполняет {counts[DATA_SIZES[-1]]}"
+            f" SQL-запросов при бюджете {budget}."
+        )
+    return check
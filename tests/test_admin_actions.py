@@ -0,0 +1,80 @@
+import pytest
+from blog.cache import FEED_TAG, get_tag_versions
+from blog.models import Category, Post
+from django.contrib.admin.models import LogEntry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def spam_posts(mixer, user, published_category):
+    return mixer.cycle(5).blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=True
+    )
+
+
+def run_action(client, url, action, objects, **data):
+    with CaptureQueriesContext(connection) as context:
+        response = client.post(url, {
+            'action': action,
+            '_selected_action': [obj.pk for obj in objects],
+            **data,
+        })
+    assert response.status_code == 302
+    return [query['sql'] for query in context.captured_queries]
+
+
+def test_unpublish_posts_in_one_update(admin_client, spam_posts):
+    versions = get_tag_versions({FEED_TAG}, create=True)
+    queries = run_action(
+        admin_client, '/admin/blog/post/', 'unpublish', spam_posts
+    )
+    assert not Post.objects.filter(is_published=True).exists()
+    updates = [sql for sql in queries if sql.startswith('UPDATE "blog_post"')]
+    assert len(updates) == 1, (
+        "Убедитесь, что массовое действие выполняет один запрос UPDATE."
+    )
+    assert LogEntry.objects.count() == 1, (
+        "Убедитесь, что массовое действие записывает одну запись в журнал"
+        " администратора."
+    )
+    assert LogEntry.objects.get().get_change_message() == (
+        'Изменено Опубликовано.'
+    ), (
+        "Убедитесь, что сообщение в журнале администратора записано в"
+        " формате JSON."
+    )
+    assert get_tag_versions({FEED_TAG}) != versions, (
+        "Убедитесь, что массовое действие сбрасывает кеш ленты."
+    )
+
+
+def test_change_category(admin_client, spam_posts, another_category):
+    another_category.title = 'Спам'
+    another_category.save()
+    run_action(
+        admin_client, '/admin/blog/post/', 'change_category', spam_posts,
+        category=another_category.pk
+    )
+    assert set(Post.objects.values_list('category', flat=True)) == {
+        another_category.pk
+    }
+    response = admin_client.get('/admin/blog/post/', {'q': 'спам'})
+    assert len(response.context['cl'].result_list) == 5, (
+        "Убедитесь, что перенос в категорию обновляет поисковый индекс."
+    )
+
+
+def test_unpublish_categories(admin_client, mixer):
+    categories = mixer.cycle(3).blend('blog.Category', is_published=True)
+    queries = run_action(
+        admin_client, '/admin/blog/category/', 'unpublish', categories
+    )
+    updates = [
+        sql for sql in queries if sql.startswith('UPDATE "blog_category"')
+    ]
+    assert len(updates) == 1
+    assert not Category.objects.filter(is_published=True).exists()
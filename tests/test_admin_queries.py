@@ -0,0 +1,98 @@
+import pytest
+from blog.models import Post
+from blog.paginators import EstimatedCountPaginator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+CHANGELISTS = (
+    '/admin/auth/user/',
+    '/admin/blog/post/',
+    '/admin/blog/comment/',
+    '/admin/blog/category/',
+    '/admin/blog/location/',
+)
+
+
+def add_rows(mixer, count):
+    users = mixer.cycle(count).blend('auth.User')
+    categories = mixer.cycle(count).blend('blog.Category')
+    locations = mixer.cycle(count).blend('blog.Location')
+    posts = mixer.cycle(count).blend(
+        'blog.Post', author=(user for user in users),
+        category=(category for category in categories),
+        location=(location for location in locations),
+    )
+    mixer.cycle(count).blend(
+        'blog.Comment', post=(post for post in posts),
+        author=(user for user in users),
+    )
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context)
+
+
+@pytest.mark.parametrize('url', CHANGELISTS)
+def test_changelist_queries_do_not_grow_with_rows(admin_client, mixer, url):
+    add_rows(mixer, 2)
+    few_rows = count_queries(admin_client, url)
+    add_rows(mixer, 20)
+    many_rows = count_queries(admin_client, url)
+    assert many_rows == few_rows, (
+        f"Убедитесь, что число запросов к БД на странице `{url}` не зависит"
+        " от количества строк в списке."
+    )
+
+
+def test_user_posts_count_is_sortable(admin_client, mixer, user):
+    mixer.cycle(3).blend('blog.Post', author=user)
+    response = admin_client.get('/admin/auth/user/', {'o': '-6'})
+    result = response.context['cl'].result_list
+    assert result[0] == user and result[0].posts_total == 3, (
+        "Убедитесь, что столбец с количеством постов пользователя"
+        " поддерживает сортировку."
+    )
+
+
+def test_changelist_counts_rows_once(admin_client, mixer):
+    add_rows(mixer, 3)
+    with CaptureQueriesContext(connection) as context:
+        admin_client.get('/admin/blog/post/', {'is_published__exact': 1})
+    counts = [
+        query['sql'] for query in context.captured_queries
+        if 'COUNT(' in query['sql']
+    ]
+    assert len(counts) == 1, (
+        "Убедитесь, что список публикаций в админке не считает общее"
+        " количество записей без учёта фильтров."
+    )
+
+
+def test_estimated_count_paginator(mixer, settings):
+    add_rows(mixer, 3)
+    settings.BLOG_ADMIN_COUNT_LIMIT = 2
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    assert EstimatedCountPaginator(Post.objects.all(), 10).count == 3, (
+        "Убедитесь, что для списка без фильтров используется оценка"
+        " количества строк из статистики БД."
+    )
+    published = Post.objects.filter(is_published=True)
+    assert EstimatedCountPaginator(published, 10).count == 2, (
+        "Убедитесь, что подсчёт строк с фильтрами ограничен настройкой"
+        " `BLOG_ADMIN_COUNT_LIMIT`."
+    )
+
+
+def test_post_form_uses_autocomplete(admin_client):
+    content = admin_client.get('/admin/blog/post/add/').content.decode()
+    for field in ('author', 'category', 'location'):
+        assert f'id="id_{field}" class="admin-autocomplete' in content, (
+            f"Убедитесь, что поле `{field}` в форме публикации использует"
+            " автодополнение."
+        )
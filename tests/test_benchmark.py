@@ -0,0 +1,60 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    return tmp_path / 'baseline.json'
+
+
+def benchmark(baseline, *args):
+    out = StringIO()
+    call_command(
+        'benchmark_views', '--repeat', '3', '--warmup', '1',
+        '--baseline', str(baseline), *args, stdout=out
+    )
+    return out.getvalue()
+
+
+def test_benchmark_saves_every_url_and_role(
+        baseline, comment, another_user
+):
+    benchmark(baseline, '--save')
+    results = json.loads(baseline.read_text())['results']
+    for name in (
+        'blog:index', 'blog:post_detail', 'blog:edit_comment',
+        'pages:about', 'pages:rules',
+    ):
+        for role in ('anonymous', 'author', 'other'):
+            assert f'{name} [{role}]' in results, (
+                f"Убедитесь, что бенчмарк замеряет `{name}` для роли"
+                f" `{role}`."
+            )
+    detail = results['blog:post_detail [author]']
+    assert detail['status'] == 200
+    assert detail['queries'] > 0 and detail['bytes'] > 0
+    assert detail['p99_ms'] >= detail['p50_ms'] > 0
+    assert detail['template_ms'] > 0
+    assert 'Регрессий нет' in benchmark(
+        baseline, '--tolerance', '100', '--min-delta-ms', '1000'
+    )
+
+
+def test_benchmark_flags_query_regressions(baseline, comment, another_user):
+    benchmark(baseline, '--save')
+    data = json.loads(baseline.read_text())
+    data['results']['blog:post_detail [author]']['queries'] = 0
+    baseline.write_text(json.dumps(data))
+    with pytest.raises(CommandError, match='blog:post_detail'):
+        benchmark(baseline)
+
+
+def test_benchmark_requires_data(baseline):
+    with pytest.raises(CommandError):
+        benchmark(baseline)
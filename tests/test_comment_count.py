@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_comments(
+        mixer, post_with_published_location, CommentModel
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend(CommentModel, post=post)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что при добавлении комментария увеличивается счётчик"
+        " `comment_count` публикации."
+    )
+    comments[0].delete()
+    CommentModel.objects.filter(pk=comments[1].pk).delete()
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что при удалении комментария уменьшается счётчик"
+        " `comment_count` публикации."
+    )
+
+
+def test_stale_post_save_keeps_comment_count(
+        mixer, post_with_published_location, CommentModel
+):
+    post = post_with_published_location
+    mixer.blend(CommentModel, post=post)
+    post.title = 'Новый заголовок'
+    post.save()
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что сохранение публикации не затирает счётчик"
+        " комментариев."
+    )
+
+
+def test_recount_comments_command(
+        mixer, post_with_published_location, CommentModel
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend(CommentModel, post=post)
+    type(post).objects.update(comment_count=0)
+    call_command('recount_comments', stdout=StringIO())
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что команда `recount_comments` пересчитывает счётчик"
+        " комментариев."
+    )
+
+
+def test_post_delete_skips_comment_receivers(
+        mixer, post_with_published_location, CommentModel
+):
+    post = post_with_published_location
+    mixer.cycle(3).blend(CommentModel, post=post)
+    with CaptureQueriesContext(connection) as ctx:
+        post.delete()
+    updates = [
+        query['sql'] for query in ctx.captured_queries
+        if query['sql'].startswith('UPDATE') and 'comment_count' in
+        query['sql']
+    ]
+    assert not updates, (
+        "Убедитесь, что при удалении публикации её комментарии не"
+        " уменьшают счётчик `comment_count` по одному."
+    )
+    assert not CommentModel.objects.exists()
+
+
+def test_moving_comment_updates_both_counts(
+        mixer, post_with_published_location, post_with_another_category,
+        CommentModel
+):
+    source = post_with_published_location
+    target = post_with_another_category
+    comment = mixer.blend(CommentModel, post=source)
+    comment.post = target
+    comment.save()
+    source.refresh_from_db()
+    target.refresh_from_db()
+    assert (source.comment_count, target.comment_count) == (0, 1), (
+        "Убедитесь, что при переносе комментария в другую публикацию"
+        " обновляются счётчики обеих публикаций."
+    )
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import parse_http_date
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def read_urls(post_with_published_location):
+    post = post_with_published_location
+    return (
+        '/',
+        f'/category/{post.category.slug}/',
+        f'/profile/{post.author.username}/',
+        f'/posts/{post.id}/',
+    )
+
+
+@pytest.mark.parametrize('client_name', ('client', 'another_user_client'))
+def test_read_views_answer_not_modified(request, client_name, read_urls):
+    request_client = request.getfixturevalue(client_name)
+    for url in read_urls:
+        response = request_client.get(url)
+        assert response.has_header('ETag'), (
+            f"Убедитесь, что страница `{url}` отдаёт заголовок ETag."
+        )
+        assert response.has_header('Last-Modified')
+        not_modified = request_client.get(
+            url, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        assert not_modified.status_code == 304, (
+            f"Убедитесь, что страница `{url}` отвечает 304 при совпадении"
+            " ETag."
+        )
+        assert not not_modified.templates
+
+
+def test_etag_changes_with_content(
+        user_client, mixer, post_with_published_location, read_urls
+):
+    etags = [user_client.get(url)['ETag'] for url in read_urls]
+    mixer.blend('blog.Comment', post=post_with_published_location)
+    for url, etag in zip(read_urls, etags):
+        assert user_client.get(url)['ETag'] != etag, (
+            f"Убедитесь, что ETag страницы `{url}` меняется после нового"
+            " комментария."
+        )
+
+
+def test_validators_do_not_aggregate_posts(user_client, read_urls):
+    for url in read_urls:
+        user_client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            user_client.get(url)
+        aggregates = [
+            query['sql'] for query in context.captured_queries
+            if 'MAX(' in query['sql'] or 'SUM(' in query['sql']
+        ]
+        assert not aggregates, (
+            f"Убедитесь, что валидаторы страницы `{url}` не пересчитывают"
+            " агрегаты по публикациям."
+        )
+
+
+def test_last_modified_moves_forward(
+        user_client, mixer, post_with_published_location, read_urls
+):
+    post = post_with_published_location
+
+    def edit():
+        post.title = 'Новый заголовок'
+        post.save()
+
+    def comment():
+        mixer.blend('blog.Comment', post=post)
+
+    def unpublish():
+        post.is_published = False
+        post.save()
+
+    start = timezone.now()
+    last_modified = {
+        url: user_client.get(url)['Last-Modified'] for url in read_urls
+    }
+    for minutes, change in enumerate((edit, comment, unpublish), start=1):
+        change()
+        with mock.patch(
+            'blog.cache.timezone.now',
+            return_value=start + timedelta(minutes=minutes)
+        ):
+            for url in read_urls:
+                response = user_client.get(url)
+                assert parse_http_date(response['Last-Modified']) > (
+                    parse_http_date(last_modified[url])
+                ), (
+                    f"Убедитесь, что Last-Modified страницы `{url}`"
+                    f" увеличивается после изменения `{change.__name__}`."
+                )
+                last_modified[url] = response['Last-Modified']
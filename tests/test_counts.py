@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from blog.models import PostCount
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    return response, sum(
+        'COUNT(*)' in query['sql'] for query in context.captured_queries
+    )
+
+
+def test_feed_count_is_cached_and_invalidated(
+        user_client, mixer, many_posts_with_published_locations
+):
+    _, first_counts = count_queries(user_client, '/')
+    response, second_counts = count_queries(user_client, '/')
+    assert first_counts == 1 and second_counts == 0, (
+        "Убедитесь, что количество публикаций в ленте кэшируется."
+    )
+    total = response.context['page_obj'].paginator.count
+    post = many_posts_with_published_locations[0]
+    post.is_published = False
+    post.save()
+    response, counts = count_queries(user_client, '/')
+    assert counts == 1
+    assert response.context['page_obj'].paginator.count == total - 1, (
+        "Убедитесь, что кэш количества публикаций сбрасывается при снятии"
+        " публикации."
+    )
+
+
+@override_settings(BLOG_APPROXIMATE_COUNTS=True)
+def test_approximate_counts_use_counter_table(
+        user_client, many_posts_with_published_locations
+):
+    category = many_posts_with_published_locations[0].category
+    url = f'/category/{category.slug}/'
+    count_queries(user_client, url)
+    counter = PostCount.objects.get(scope=f'category:{category.pk}')
+    _, counts = count_queries(user_client, url)
+    assert counts == 0, (
+        "Убедитесь, что в приближённом режиме количество берётся из таблицы"
+        " счётчиков."
+    )
+    many_posts_with_published_locations[0].delete()
+    assert not PostCount.objects.filter(pk=counter.pk).exists(), (
+        "Убедитесь, что счётчик сбрасывается при удалении публикации."
+    )
+
+
+@override_settings(BLOG_APPROXIMATE_COUNTS=True)
+def test_approximate_counter_expires_at_next_scheduled_post(
+        user_client, mixer, many_posts_with_published_locations
+):
+    category = many_posts_with_published_locations[0].category
+    url = f'/category/{category.slug}/'
+    scheduled = mixer.blend(
+        'blog.Post', category=category, is_published=True,
+        pub_date=timezone.now() + timedelta(minutes=2)
+    )
+    response, _ = count_queries(user_client, url)
+    total = response.context['page_obj'].paginator.count
+    counter = PostCount.objects.get(scope=f'category:{category.pk}')
+    assert counter.valid_until == scheduled.pub_date, (
+        "Убедитесь, что счётчик действителен до ближайшей отложенной"
+        " публикации."
+    )
+    type(scheduled).objects.filter(pk=scheduled.pk).update(
+        pub_date=timezone.now() - timedelta(minutes=1)
+    )
+    PostCount.objects.filter(pk=counter.pk).update(
+        valid_until=timezone.now() - timedelta(minutes=1)
+    )
+    response, counts = count_queries(user_client, url)
+    assert counts == 1
+    assert response.context['page_obj'].paginator.count == total + 1, (
+        "Убедитесь, что счётчик пересчитывается после наступления даты"
+        " отложенной публикации."
+    )
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+import pytest
+from blog.paginators import encode_cursor
+from conftest import N_PER_PAGE
+from django.test import override_settings
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def feed_posts(mixer, user, published_category):
+    now = timezone.now()
+    return mixer.cycle(N_PER_PAGE * 2 + 1).blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=(now - timedelta(days=day) for day in range(1, 100)),
+    )
+
+
+@override_settings(BLOG_CURSOR_PAGINATION=True)
+def test_cursor_pagination_walks_feed(client, feed_posts):
+    expected = sorted(
+        feed_posts, key=lambda post: (post.pub_date, post.pk), reverse=True
+    )
+    first = client.get('/').context['page_obj']
+    assert first.is_cursor and not first.has_previous()
+    second = client.get(f'/?after={first.next_cursor}').context['page_obj']
+    third = client.get(f'/?after={second.next_cursor}').context['page_obj']
+    assert not third.has_next(), (
+        "Убедитесь, что на последней странице нет ссылки на следующую."
+    )
+    walked = list(first) + list(second) + list(third)
+    assert walked == expected, (
+        "Убедитесь, что курсорная пагинация выводит публикации по убыванию"
+        " даты публикации без пропусков и повторов."
+    )
+    back = client.get(f'/?before={second.previous_cursor}').context[
+        'page_obj']
+    assert list(back) == list(first)
+    assert not back.has_previous()
+
+
+@override_settings(BLOG_CURSOR_PAGINATION=True)
+def test_cursor_pagination_empty_pages(client, feed_posts):
+    ordered = sorted(feed_posts, key=lambda post: (post.pub_date, post.pk))
+    oldest, newest = encode_cursor(ordered[0]), encode_cursor(ordered[-1])
+    for query in (f'after={oldest}', f'before={newest}'):
+        response = client.get(f'/?{query}')
+        assert response.status_code == 200, (
+            "Убедитесь, что пустая страница курсорной пагинации не приводит"
+            " к ошибке сервера."
+        )
+        page = response.context['page_obj']
+        assert not list(page)
+        assert not page.has_next() and not page.has_previous()
+        assert page.next_cursor is None and page.previous_cursor is None
+
+
+@override_settings(BLOG_CURSOR_PAGINATION=True)
+def test_cursor_pagination_keeps_page_urls(client, feed_posts):
+    response = client.get('/?page=2')
+    assert response.context['page_obj'].number == 2, (
+        "Убедитесь, что старые ссылки вида `?page=N` продолжают работать."
+    )
+    assert client.get('/?after=broken').status_code == 404
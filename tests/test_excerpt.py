@@ -0,0 +1,32 @@
+import pytest
+from django.db import connection
+from django.template.defaultfilters import truncatewords
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_excerpt_matches_truncated_text(post_with_published_location):
+    post = post_with_published_location
+    post.text = ' '.join(f'слово{i}' for i in range(50))
+    post.save()
+    post.refresh_from_db()
+    assert post.excerpt == truncatewords(post.text, 10), (
+        "Убедитесь, что анонс публикации совпадает с первыми десятью"
+        " словами текста."
+    )
+
+
+def test_feed_does_not_load_post_text(
+        user_client, many_posts_with_published_locations
+):
+    with CaptureQueriesContext(connection) as context:
+        response = user_client.get('/')
+    assert response.status_code == 200
+    post_queries = [
+        query['sql'] for query in context.captured_queries
+        if 'FROM "blog_post"' in query['sql']
+    ]
+    assert post_queries and not any(
+        '"blog_post"."text"' in sql for sql in post_queries
+    ), "Убедитесь, что лента не загружает полный текст публикаций."
@@ -0,0 +1,117 @@
+import csv
+import json
+from io import StringIO
+
+import pytest
+from blog.models import Comment, Post, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def export(*args):
+    out = StringIO()
+    call_command('export_blog', *args, stdout=out, stderr=StringIO())
+    return out.getvalue()
+
+
+def test_export_jsonl_writes_dumpdata_records(
+        tmp_path, post_with_published_location, comment
+):
+    path = tmp_path / 'export.jsonl'
+    call_command(
+        'export_blog', '--output', str(path), stderr=StringIO()
+    )
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert {record['model'] for record in records} == {
+        'auth.user', 'blog.category', 'blog.location', 'blog.post',
+        'blog.comment'
+    }
+    post = next(record for record in records if record['model'] == 'blog.post')
+    assert post['pk'] == post_with_published_location.pk
+    assert post['fields']['title'] == post_with_published_location.title
+    assert 'excerpt' not in post['fields']
+
+
+def test_export_filters_and_watermark(
+        posts_with_unpublished_category, future_posts,
+        many_posts_with_published_locations
+):
+    visible = {post.pk for post in many_posts_with_published_locations}
+    rows = list(csv.DictReader(StringIO(
+        export('post', '--format', 'csv', '--published')
+    )))
+    assert {int(row['pk']) for row in rows} == visible, (
+        "Убедитесь, что флаг `--published` выгружает только публикации,"
+        " видимые читателям."
+    )
+    watermark = sorted(visible)[len(visible) // 2]
+    rest = export('post', '--published', '--after-pk', str(watermark))
+    assert {json.loads(line)['pk'] for line in rest.splitlines()} == {
+        pk for pk in visible if pk > watermark
+    }, "Убедитесь, что `--after-pk` продолжает выгрузку после указанного pk."
+
+
+def test_export_date_range(many_posts_with_published_locations):
+    posts = Post.objects.order_by('pub_date')
+    since = posts[1].pub_date.isoformat()
+    lines = export('post', '--since', since).splitlines()
+    assert len(lines) == posts.count() - 1
+
+
+def test_export_streams_with_projection(many_posts_with_published_locations):
+    with CaptureQueriesContext(connection) as context:
+        export('post', '--chunk-size', '3')
+    sql = context.captured_queries[-1]['sql']
+    assert '"blog_post"."excerpt"' not in sql, (
+        "Убедитесь, что выгрузка читает только нужные столбцы."
+    )
+
+
+def test_export_import_round_trip(
+        tmp_path, post_with_published_location, comment
+):
+    path = tmp_path / 'export.jsonl'
+    call_command('export_blog', '--output', str(path), stderr=StringIO())
+    titles = set(Post.objects.values_list('title', 'author__username'))
+    comments = set(Comment.objects.values_list('text', 'author__username'))
+    User.objects.all().delete()
+    assert not Post.objects.exists()
+    call_command('import_blog', str(path), stdout=StringIO())
+    assert set(
+        Post.objects.values_list('title', 'author__username')
+    ) == titles, (
+        "Убедитесь, что публикации, выгруженные `export_blog`, загружаются"
+        " обратно командой `import_blog` вместе с авторами."
+    )
+    assert set(
+        Comment.objects.values_list('text', 'author__username')
+    ) == comments
+    assert not any(
+        user.has_usable_password() for user in User.objects.all()
+    )
+
+
+def test_export_watermark_per_model(
+        post_with_published_location, comment,
+        many_posts_with_published_locations
+):
+    last_post = Post.objects.order_by('pk').last().pk
+    records = [
+        json.loads(line)
+        for line in export('--after-pk', f'post={last_post - 1}').splitlines()
+    ]
+    assert [
+        record['pk'] for record in records if record['model'] == 'blog.post'
+    ] == [last_post]
+    assert {
+        record['pk'] for record in records if record['model'] == 'blog.comment'
+    } == set(Comment.objects.values_list('pk', flat=True)), (
+        "Убедитесь, что `--after-pk post=N` не отбрасывает записи других"
+        " моделей."
+    )
+    with pytest.raises(CommandError):
+        export('--after-pk', str(last_post))
@@ -0,0 +1,62 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.images import ImageFile
+from django.core.files.storage import Storage
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def make_image_file(name, color=(73, 109, 137)):
+    buffer = BytesIO()
+    Image.new('RGB', (120, 80), color=color).save(buffer, format='JPEG')
+    return ImageFile(buffer, name=name)
+
+
+def test_image_metadata_stored_on_upload(mixer, user):
+    post = mixer.blend(
+        'blog.Post', author=user, image=make_image_file('first.jpg')
+    )
+    post.refresh_from_db()
+    assert post.image_meta['width'] == 120
+    assert post.image_meta['height'] == 80
+    assert post.image_meta['size'] == post.image.size
+    assert post.image.name.endswith(f'{post.image_meta["sha256"]}.jpg'), (
+        "Убедитесь, что изображение сохраняется под именем, построенным из"
+        " хеша его содержимого."
+    )
+
+
+def test_identical_uploads_share_one_file(mixer, user):
+    first, second = (
+        mixer.blend('blog.Post', author=user, image=make_image_file(name))
+        for name in ('first.jpg', 'copy_of_first.jpg')
+    )
+    assert first.image.name == second.image.name, (
+        "Убедитесь, что одинаковые изображения хранятся в одном файле."
+    )
+    other = mixer.blend(
+        'blog.Post', author=user,
+        image=make_image_file('other.jpg', color=(0, 0, 0))
+    )
+    assert other.image.name != first.image.name
+
+
+def test_feed_renders_dimensions_without_storage(
+        client, mixer, user, published_category, monkeypatch
+):
+    mixer.blend(
+        'blog.Post', author=user, category=published_category,
+        is_published=True, image=make_image_file('first.jpg')
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError(
+            "Убедитесь, что для вывода размеров изображения не открывается"
+            " файл в хранилище."
+        )
+
+    monkeypatch.setattr(Storage, 'open', fail)
+    content = client.get('/').content.decode()
+    assert 'width="120" height="80"' in content
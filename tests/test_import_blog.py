@@ -0,0 +1,97 @@
+import json
+from io import StringIO
+
+import pytest
+from blog import bulk
+from blog.models import Category, Comment, Location, Post, User
+from blog.search import search_posts
+from django.conf import settings
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+RECORDS = [
+    {'model': 'blog.category', 'pk': 7, 'fields': {
+        'title': 'Путешествия', 'slug': 'travel', 'description': 'Описание',
+        'is_published': True, 'created_at': '2022-12-18T23:03:52Z',
+    }},
+    {'model': 'blog.post', 'pk': 3, 'fields': {
+        'title': 'Поход', 'text': ' '.join(['слово'] * 30),
+        'pub_date': '2022-12-01T10:00:00Z', 'is_published': True,
+        'created_at': '2022-12-02T10:00:00Z',
+        'author': 5, 'category': 7, 'location': None,
+    }},
+    {'model': 'blog.comment', 'pk': 1, 'fields': {
+        'text': 'Комментарий', 'post': 3, 'author': 5,
+        'created_at': '2022-12-03T10:00:00Z',
+    }},
+    {'model': 'admin.logentry', 'pk': 1, 'fields': {}},
+    {'model': 'auth.user', 'pk': 5, 'fields': {
+        'username': 'traveller', 'password': '!', 'groups': [],
+    }},
+]
+
+
+def import_file(tmp_path, content, *args):
+    path = tmp_path / 'import.json'
+    path.write_text(content, encoding='utf-8')
+    out = StringIO()
+    call_command('import_blog', str(path), *args, stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize('jsonl', (False, True))
+def test_import_resolves_forward_references(tmp_path, monkeypatch, jsonl):
+    monkeypatch.setattr(bulk, 'CHUNK_SIZE', 7)
+    if jsonl:
+        content = '\n'.join(json.dumps(record) for record in RECORDS)
+    else:
+        content = json.dumps(RECORDS, ensure_ascii=False, indent=2)
+    output = import_file(tmp_path, content, '--chunk-size', '1')
+    post = Post.objects.select_related('author', 'category').get()
+    assert post.author.username == 'traveller', (
+        "Убедитесь, что `import_blog` связывает публикации с авторами,"
+        " даже если пользователи идут в файле после публикаций."
+    )
+    assert post.category == Category.objects.get(slug='travel')
+    assert post.created_at.year == 2022, (
+        "Убедитесь, что `import_blog` сохраняет исходную дату создания."
+    )
+    assert post.excerpt.startswith('слово') and len(post.excerpt) < 100
+    assert post.comment_count == 1 == Comment.objects.count()
+    assert list(search_posts(Post.objects, 'поход')) == [post]
+    assert 'admin.logentry: пропущено 1' in output
+    assert 'строк/с' in output
+
+
+def test_import_reuses_existing_users(tmp_path, mixer):
+    user = mixer.blend('auth.User', username='traveller')
+    import_file(tmp_path, json.dumps(RECORDS))
+    assert User.objects.count() == 1
+    assert Post.objects.get().author == user
+
+
+def test_import_keeps_locations_with_same_name(tmp_path, mixer):
+    mixer.blend('blog.Location', name='Остров', is_published=True)
+    records = [
+        {'model': 'blog.location', 'pk': pk, 'fields': {
+            'name': 'Остров', 'is_published': is_published,
+        }}
+        for pk, is_published in ((1, True), (2, False))
+    ]
+    import_file(tmp_path, json.dumps(records))
+    assert sorted(
+        Location.objects.values_list('is_published', flat=True)
+    ) == [False, True, True], (
+        "Убедитесь, что `import_blog` не объединяет разные местоположения"
+        " с одинаковым названием."
+    )
+
+
+def test_import_project_fixture():
+    call_command(
+        'import_blog', str(settings.BASE_DIR / '..' / 'db.json'),
+        stdout=StringIO()
+    )
+    assert Post.objects.count() == 39
+    assert not Post.objects.filter(excerpt='').exists()
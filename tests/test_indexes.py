@@ -0,0 +1,73 @@
+from io import StringIO
+
+import pytest
+from blog import views
+from blog.models import Post
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != 'sqlite', reason='EXPLAIN QUERY PLAN из SQLite'
+    ),
+]
+
+FEED_INDEXES = {
+    views.PageListView: 'post_published_pub_date_idx',
+    views.CategoryPostListView: 'post_category_pub_date_idx',
+    views.ProfileListView: 'post_author_pub_date_idx',
+    views.PostListView: 'comment_post_created_idx',
+}
+
+
+def get_main_queryset(view_class, request_user, **kwargs):
+    request = RequestFactory().get('/')
+    request.user = request_user
+    view = view_class()
+    view.setup(request, **kwargs)
+    return view.get_queryset()
+
+
+@pytest.fixture
+def seeded_blog():
+    call_command(
+        'seed_blog', users=20, categories=4, locations=4, posts=500,
+        comments=1000, stdout=StringIO()
+    )
+    return views.filter_posts(Post.objects).select_related(
+        'author', 'category'
+    ).order_by('-comment_count').first()
+
+
+@pytest.mark.parametrize('analyze', (False, True))
+@pytest.mark.parametrize('anonymous', (False, True))
+def test_views_use_feed_indexes(seeded_blog, anonymous, analyze):
+    post = seeded_blog
+    if analyze:
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    request_user = AnonymousUser() if anonymous else post.author
+    cases = (
+        (views.PageListView, {}),
+        (views.CategoryPostListView, {'category_slug': post.category.slug}),
+        (views.ProfileListView, {'username': post.author.username}),
+        (views.PostListView, {'post_id': post.id}),
+    )
+    for view_class, kwargs in cases:
+        plan = get_main_queryset(view_class, request_user, **kwargs).explain()
+        assert FEED_INDEXES[view_class] in plan, (
+            f"Убедитесь, что основной запрос `{view_class.__name__}`"
+            f" использует составной индекс. План запроса:\n{plan}"
+        )
+        assert 'SCAN blog_post' not in plan, (
+            f"Убедитесь, что основной запрос `{view_class.__name__}`"
+            f" не просматривает таблицу публикаций целиком. План запроса:"
+            f"\n{plan}"
+        )
+        assert 'USE TEMP B-TREE FOR ORDER BY' not in plan, (
+            f"Убедитесь, что основной запрос `{view_class.__name__}`"
+            f" не сортирует строки отдельно. План запроса:\n{plan}"
+        )
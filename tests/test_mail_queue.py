@@ -0,0 +1,51 @@
+from django.core import mail
+from django.core.mail import EmailMessage, send_mail
+from tasks import mail as mail_queue_module
+from tasks.mail import MailQueue
+
+LOCMEM_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+def make_messages(count):
+    return [
+        EmailMessage(f'Тема {i}', 'Текст', to=['user@example.com'])
+        for i in range(count)
+    ]
+
+
+def test_messages_are_delivered_in_batches(mailoutbox):
+    queue = MailQueue(LOCMEM_BACKEND, batch_size=3, flush_interval=1)
+    queue.put(make_messages(7))
+    queue.flush()
+    assert len(mailoutbox) == 7, (
+        "Убедитесь, что все письма из очереди доставлены."
+    )
+    stats = queue.stats()
+    assert stats['batches'] == 3, (
+        "Убедитесь, что письма отправляются пачками не больше"
+        " `batch_size` за одно соединение."
+    )
+    assert stats['sent'] == 7
+    assert stats['depth'] == 0
+    assert stats['max_latency'] >= stats['avg_latency'] > 0
+
+
+def test_failed_delivery_is_counted(mailoutbox):
+    queue = MailQueue('tasks.missing.Backend', batch_size=5, flush_interval=0)
+    queue.put(make_messages(2))
+    queue.flush()
+    assert queue.stats()['failed'] == 2
+
+
+def test_queued_backend_hands_off_to_downstream(
+        settings, mailoutbox, monkeypatch
+):
+    settings.EMAIL_BACKEND = 'tasks.mail.QueuedEmailBackend'
+    settings.EMAIL_QUEUE_BACKEND = LOCMEM_BACKEND
+    monkeypatch.setattr(mail_queue_module, 'mail_queue', None)
+    assert send_mail('Тема', 'Текст', None, ['user@example.com']) == 1
+    mail_queue_module.get_mail_queue().flush()
+    assert len(mail.outbox) == 1, (
+        "Убедитесь, что `QueuedEmailBackend` передаёт письма в бэкенд"
+        " из настройки `EMAIL_QUEUE_BACKEND`."
+    )
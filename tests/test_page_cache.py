@@ -0,0 +1,107 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from blog.cache import FEED_TAG, invalidate_tags, post_tag
+from blog.models import Post
+from django.urls import resolve
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_anonymous_feed_served_from_cache(
+        client, post_with_published_location, django_assert_num_queries
+):
+    first = client.get('/')
+    with django_assert_num_queries(0):
+        second = client.get('/')
+    assert second.content == first.content, (
+        "Убедитесь, что повторный запрос ленты анонимным пользователем"
+        " отдаётся из кэша."
+    )
+
+
+def test_authenticated_pages_are_not_cached(
+        user_client, post_with_published_location
+):
+    user_client.get('/')
+    response = user_client.get('/')
+    assert response.context is not None, (
+        "Убедитесь, что страницы авторизованных пользователей не кэшируются."
+    )
+
+
+def test_post_changes_invalidate_listing_pages(
+        client, post_with_published_location
+):
+    post = post_with_published_location
+    client.get('/')
+    client.get(f'/category/{post.category.slug}/')
+    post.title = 'Обновлённый заголовок'
+    post.save()
+    assert 'Обновлённый заголовок' in client.get('/').content.decode()
+    assert 'Обновлённый заголовок' in client.get(
+        f'/category/{post.category.slug}/').content.decode()
+
+
+def test_invalidation_is_scoped(
+        client, mixer, post_with_published_location, another_category
+):
+    post = post_with_published_location
+    url = f'/category/{post.category.slug}/'
+    client.get(url)
+    mixer.blend(
+        'blog.Post', category=another_category, is_published=True,
+        pub_date=timezone.now() - timedelta(days=1)
+    )
+    assert client.get(url).context is None, (
+        "Убедитесь, что публикация в другой категории не сбрасывает кэш"
+        " страницы категории."
+    )
+    mixer.blend('blog.Comment', post=post)
+    assert client.get(url).context is not None, (
+        "Убедитесь, что новый комментарий сбрасывает кэш страниц,"
+        " на которых выводится публикация."
+    )
+
+
+def test_cache_expires_at_next_scheduled_post(
+        client, mixer, post_with_published_location
+):
+    mixer.blend(
+        'blog.Post', category=post_with_published_location.category,
+        is_published=True, pub_date=timezone.now() + timedelta(minutes=2)
+    )
+    with mock.patch(
+        'blog.mixins.set_cached_page', return_value=None
+    ) as set_cached_page:
+        client.get('/')
+    timeout = set_cached_page.call_args.args[3]
+    assert 0 < timeout <= 120, (
+        "Убедитесь, что кэш страницы истекает к дате ближайшей отложенной"
+        " публикации."
+    )
+
+
+def test_page_stored_under_versions_read_before_queries(
+        client, post_with_published_location
+):
+    post = post_with_published_location
+    view = resolve('/').func.view_class
+    get_queryset = view.get_queryset
+
+    def edit_during_request(self):
+        queryset = get_queryset(self)
+        Post.objects.filter(pk=post.pk).update(title='Новый заголовок')
+        invalidate_tags(post_tag(post.pk), FEED_TAG)
+        return queryset
+
+    with mock.patch.object(view, 'get_queryset', edit_during_request):
+        client.get('/')
+    response = client.get('/')
+    assert response.context is not None, (
+        "Убедитесь, что страница, данные которой изменились во время"
+        " запроса, не отдаётся из кэша."
+    )
+    assert 'Новый заголовок' in response.content.decode()
@@ -0,0 +1,17 @@
+from django.core.paginator import Paginator
+from django.template.loader import render_to_string
+
+
+def test_paginator_markup_does_not_grow_with_page_count():
+    sizes = []
+    for total in (100, 500_000):
+        page_obj = Paginator(range(total), 10).page(5)
+        html = render_to_string(
+            'includes/paginator.html', {'page_obj': page_obj}
+        )
+        assert f'?page={page_obj.paginator.num_pages}' in html
+        sizes.append(html.count('<li'))
+    assert sizes[0] == sizes[1], (
+        "Убедитесь, что пагинатор выводит окно ссылок вокруг текущей"
+        " страницы, а не ссылки на все страницы."
+    )
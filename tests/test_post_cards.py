@@ -0,0 +1,39 @@
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+CARD_TEMPLATE = 'includes/post_card.html'
+
+
+def rendered_cards(response):
+    return sum(
+        template.name == CARD_TEMPLATE for template in response.templates
+    )
+
+
+def test_post_cards_rendered_from_cache(
+        user_client, many_posts_with_published_locations
+):
+    assert rendered_cards(user_client.get('/')) > 0
+    assert rendered_cards(user_client.get('/')) == 0, (
+        "Убедитесь, что карточки публикаций берутся из кэша фрагментов."
+    )
+
+
+def test_post_card_version_follows_related_objects(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get('/')
+    post.author.username = 'renamed_author'
+    post.author.save()
+    response = user_client.get('/')
+    assert rendered_cards(response) == 1
+    assert '@renamed_author' in response.content.decode(), (
+        "Убедитесь, что карточка обновляется при смене имени автора."
+    )
+    post.location.name = 'Новое место'
+    post.location.save()
+    assert 'Новое место' in user_client.get('/').content.decode(), (
+        "Убедитесь, что карточка обновляется при изменении местоположения."
+    )
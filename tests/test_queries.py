@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def count_table_queries(client, url, table):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return sum(
+        query['sql'].startswith('SELECT')
+        and f'FROM "{table}"' in query['sql']
+        for query in context.captured_queries
+    )
+
+
+def test_post_detail_fetches_post_once(
+        user_client, client, post_with_published_location
+):
+    url = f'/posts/{post_with_published_location.id}/'
+    for request_client in (user_client, client):
+        assert count_table_queries(request_client, url, 'blog_post') == 1, (
+            "Убедитесь, что страница публикации загружает пост одним"
+            " запросом."
+        )
+
+
+def test_list_views_resolve_lookups_once(
+        client, post_with_published_location
+):
+    post = post_with_published_location
+    assert count_table_queries(
+        client, f'/category/{post.category.slug}/', 'blog_category'
+    ) == 1, "Убедитесь, что категория загружается один раз за запрос."
+    assert count_table_queries(
+        client, f'/profile/{post.author.username}/', 'auth_user'
+    ) == 1, "Убедитесь, что автор профиля загружается один раз за запрос."
+
+
+@pytest.mark.parametrize(
+    ('url_pattern', 'expected_queries'),
+    (
+        # Сессия, пользователь, пост, варианты категорий и местоположений.
+        ('/posts/{post.id}/edit/', 5),
+        # Сессия, пользователь, пост.
+        ('/posts/{post.id}/delete/', 3),
+        # Сессия, пользователь, комментарий.
+        ('/posts/{post.id}/edit_comment/{comment.id}/', 3),
+        ('/posts/{post.id}/delete_comment/{comment.id}/', 3),
+    ),
+)
+def test_edit_views_fetch_object_once(
+        user_client, post_with_published_location, mixer, CommentModel,
+        django_assert_num_queries, url_pattern, expected_queries
+):
+    post = post_with_published_location
+    comment = mixer.blend(CommentModel, post=post, author=post.author)
+    url = url_pattern.format(post=post, comment=comment)
+    with django_assert_num_queries(expected_queries):
+        response = user_client.get(url)
+    assert response.status_code == 200
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import blog.urls
+import pages.urls
+import pytest
+from django.urls import reverse
+from fixtures.query_budget import LOGIN_REQUIRED, QUERY_BUDGETS
+
+pytestmark = [pytest.mark.django_db]
+
+URL_NAMES = [
+    f'{module.app_name}:{pattern.name}'
+    for module in (blog.urls, pages.urls)
+    for pattern in module.urlpatterns
+]
+
+
+def test_every_url_has_query_budget():
+    assert set(URL_NAMES) <= set(QUERY_BUDGETS), (
+        "Задайте бюджет SQL-запросов в `QUERY_BUDGETS` для страниц:"
+        f" {sorted(set(URL_NAMES) - set(QUERY_BUDGETS))}."
+    )
+
+
+@pytest.mark.parametrize('url_name', URL_NAMES)
+@pytest.mark.parametrize('role', ('anonymous', 'author'))
+def test_query_count_does_not_grow_with_data(
+        url_name, role, client, user_client, growing_blog,
+        assert_query_budget
+):
+    pattern = next(
+        pattern for module in (blog.urls, pages.urls)
+        for pattern in module.urlpatterns
+        if f'{module.app_name}:{pattern.name}' == url_name
+    )
+
+    def get_url():
+        kwargs = growing_blog.url_kwargs
+        url = reverse(url_name, kwargs={
+            name: kwargs[name] for name in pattern.pattern.regex.groupindex
+        })
+        return url + '?q=Заметка' if url_name == 'blog:search' else url
+
+    anonymous_budget, author_budget = QUERY_BUDGETS[url_name]
+    if role == 'anonymous':
+        status = (
+            HTTPStatus.FOUND if url_name in LOGIN_REQUIRED else HTTPStatus.OK
+        )
+    else:
+        status = HTTPStatus.OK
+    assert_query_budget(
+        client if role == 'anonymous' else user_client, url_name, get_url,
+        growing_blog.grow,
+        anonymous_budget if role == 'anonymous' else author_budget,
+        status,
+    )
@@ -0,0 +1,86 @@
+from io import BytesIO, StringIO
+
+import pytest
+from blog.images import rendition_name
+from blog.tasks import build_post_renditions
+from django.core.files.images import ImageFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from PIL import Image
+
+pytestmark = [pytest.mark.django_db]
+
+
+def blend_large_image_post(mixer, user, category):
+    buffer = BytesIO()
+    Image.new('RGB', (2000, 1000), color=(73, 109, 137)).save(
+        buffer, format='JPEG'
+    )
+    return mixer.blend(
+        'blog.Post', author=user, category=category, is_published=True,
+        image=ImageFile(buffer, name='large_image.jpg')
+    )
+
+
+@pytest.fixture
+def large_image_post(
+        mixer, user, published_category, settings,
+        django_capture_on_commit_callbacks
+):
+    settings.TASKS_ALWAYS_EAGER = True
+    with django_capture_on_commit_callbacks(execute=True):
+        return blend_large_image_post(mixer, user, published_category)
+
+
+def test_renditions_built_on_upload(large_image_post):
+    name = large_image_post.image.name
+    for width in (640, 960, 1280, 1920):
+        rendition = rendition_name(name, width)
+        assert default_storage.exists(rendition), (
+            "Убедитесь, что при загрузке изображения создаются его"
+            " уменьшенные копии."
+        )
+        with default_storage.open(rendition) as file:
+            assert Image.open(file).size[0] == width
+
+
+def test_post_pages_use_srcset(client, large_image_post):
+    url_640 = default_storage.url(
+        rendition_name(large_image_post.image.name, 640)
+    )
+    feed = client.get('/').content.decode()
+    assert f'src="{url_640}"' in feed and 'srcset=' in feed, (
+        "Убедитесь, что карточка публикации использует уменьшенную копию"
+        " изображения и атрибут srcset."
+    )
+    assert 'width="640" height="320"' in feed
+    detail = client.get(f'/posts/{large_image_post.id}/').content.decode()
+    assert 'width="960" height="480"' in detail
+
+
+def test_build_renditions_command(large_image_post):
+    name = rendition_name(large_image_post.image.name, 640)
+    default_storage.delete(name)
+    call_command('build_renditions', stdout=StringIO())
+    assert default_storage.exists(name)
+
+
+def test_original_served_until_renditions_are_built(
+        client, mixer, user, published_category, settings
+):
+    settings.TASKS_ALWAYS_EAGER = False
+    post = blend_large_image_post(mixer, user, published_category)
+    feed = client.get('/').content.decode()
+    assert f'src="{post.image.url}"' in feed and '_640w.jpg' not in feed, (
+        "Убедитесь, что до создания уменьшенных копий карточка использует"
+        " исходное изображение."
+    )
+    build_post_renditions(post.pk)
+    post.refresh_from_db()
+    assert post.image_meta['renditions'] == [640, 960, 1280, 1920], (
+        "Убедитесь, что созданные копии записываются в `image_meta`."
+    )
+    url_640 = default_storage.url(rendition_name(post.image.name, 640))
+    assert f'src="{url_640}"' in client.get('/').content.decode(), (
+        "Убедитесь, что после создания копий кэш карточки сбрасывается."
+    )
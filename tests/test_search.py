@@ -0,0 +1,87 @@
+import pytest
+from blog.models import Post
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def searchable_posts(mixer, user, published_category):
+    def make(title, text, **kwargs):
+        return mixer.blend(
+            'blog.Post', title=title, text=text, author=user,
+            category=published_category, is_published=True,
+            pub_date=timezone.now() - timezone.timedelta(days=1), **kwargs
+        )
+    return {
+        'title': make('Путешествие в горы', 'Короткая заметка'),
+        'text': make('Заметка', 'Мы долго шли в горы и устали'),
+        'other': make('Рецепт пирога', 'Мука, яйца, сахар'),
+    }
+
+
+def search(client, query):
+    response = client.get('/search/', {'q': query})
+    assert response.status_code == 200, (
+        "Убедитесь, что страница поиска `/search/` доступна."
+    )
+    return list(response.context['page_obj'])
+
+
+def test_search_ranks_title_matches_first(client, searchable_posts):
+    found = search(client, 'горы')
+    assert found == [searchable_posts['title'], searchable_posts['text']], (
+        "Убедитесь, что поиск находит публикации по заголовку и тексту и"
+        " ставит совпадения в заголовке выше."
+    )
+
+
+@pytest.mark.parametrize('query', ('', '!!!'))
+def test_search_without_words_is_empty(client, searchable_posts, query):
+    assert search(client, query) == [], (
+        "Убедитесь, что пустой поисковый запрос не возвращает публикаций."
+    )
+
+
+def test_search_matches_prefix_and_related_fields(
+        client, searchable_posts, user
+):
+    assert search(client, 'пирог') == [searchable_posts['other']]
+    assert len(search(client, user.username)) == 3, (
+        "Убедитесь, что поиск учитывает имя автора публикации."
+    )
+
+
+def test_search_respects_visibility(client, searchable_posts):
+    post = searchable_posts['other']
+    post.is_published = False
+    post.save()
+    assert search(client, 'пирог') == [], (
+        "Убедитесь, что поиск не показывает снятые с публикации записи."
+    )
+    post.category.is_published = False
+    post.category.save()
+    assert search(client, 'горы') == []
+
+
+def test_index_follows_edits_and_deletes(client, searchable_posts):
+    post = searchable_posts['other']
+    post.title = 'Рецепт торта'
+    post.save()
+    assert search(client, 'торта') == [post], (
+        "Убедитесь, что индекс поиска обновляется при изменении публикации."
+    )
+    post.category.title = 'Выпечка'
+    post.category.save()
+    assert len(search(client, 'выпечка')) == 3
+    post.delete()
+    assert search(client, 'торта') == []
+
+
+def test_admin_search_uses_index(admin_client, searchable_posts):
+    response = admin_client.get('/admin/blog/post/', {'q': 'горы'})
+    assert set(response.context['cl'].result_list) == set(
+        Post.objects.filter(pk__in=[
+            searchable_posts['title'].pk, searchable_posts['text'].pk
+        ])
+    )
@@ -0,0 +1,62 @@
+from io import StringIO
+
+import pytest
+from blog.models import Category, Comment, Location, Post, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Sum
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+SIZES = {
+    'users': 10, 'categories': 3, 'locations': 4,
+    'posts': 200, 'comments': 500,
+}
+
+
+def seed(**options):
+    call_command('seed_blog', stdout=StringIO(), **{**SIZES, **options})
+
+
+def test_seed_creates_requested_shape():
+    seed(future_fraction=0.2, unpublished_fraction=0.2)
+    assert (
+        User.objects.count(), Category.objects.count(),
+        Location.objects.count(), Post.objects.count(),
+        Comment.objects.count(),
+    ) == tuple(SIZES.values()), (
+        "Убедитесь, что `seed_blog` создаёт заданное количество объектов."
+    )
+    assert Post.objects.filter(pub_date__gt=timezone.now()).exists()
+    assert Post.objects.filter(is_published=False).exists()
+    assert Post.objects.aggregate(
+        total=Sum('comment_count')
+    )['total'] == SIZES['comments']
+    busiest = Post.objects.order_by('-comment_count').first()
+    assert busiest.comment_count > SIZES['comments'] / SIZES['posts'] * 5, (
+        "Убедитесь, что комментарии распределены с длинным хвостом."
+    )
+    assert not Post.objects.filter(excerpt='').exists()
+
+
+def test_seed_is_reproducible():
+    seed(seed=7)
+    first = list(Post.objects.order_by('pk').values_list('title', flat=True))
+    Post.objects.all().delete()
+    seed(seed=7)
+    second = list(Post.objects.order_by('pk').values_list('title', flat=True))
+    assert first == second, (
+        "Убедитесь, что при одинаковом `--seed` генерируются одинаковые"
+        " данные."
+    )
+
+
+@pytest.mark.parametrize('options', [
+    {'users': 0, 'posts': 0},
+    {'posts': 0},
+])
+def test_seed_rejects_comments_without_authors_or_posts(options):
+    with pytest.raises(CommandError):
+        seed(**options)
+    assert not Comment.objects.exists()
@@ -0,0 +1,59 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from tasks.models import Task
+from tasks.registry import task
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+calls = []
+
+
+@task
+def remember(value):
+    calls.append(value)
+
+
+@task(max_attempts=2, retry_delay=0)
+def always_fails():
+    raise RuntimeError('boom')
+
+
+def run_tasks():
+    call_command('run_tasks', '--once', stdout=StringIO())
+
+
+def test_delay_enqueues_and_worker_runs():
+    calls.clear()
+    remember.delay('a')
+    remember.delay('b')
+    assert not calls, (
+        "Убедитесь, что `delay()` только ставит задачу в очередь."
+    )
+    assert Task.objects.count() == 2
+    run_tasks()
+    assert sorted(calls) == ['a', 'b'], (
+        "Убедитесь, что обработчик выполняет задачи из очереди."
+    )
+    assert not Task.objects.exists()
+
+
+def test_failed_task_is_retried_then_marked_failed():
+    always_fails.delay()
+    run_tasks()
+    failed = Task.objects.get()
+    assert failed.status == Task.FAILED, (
+        "Убедитесь, что задача повторяется до `max_attempts` раз и затем"
+        " помечается как ошибочная."
+    )
+    assert failed.attempts == 2
+    assert 'RuntimeError: boom' in failed.last_error
+
+
+def test_eager_mode_runs_on_commit(settings):
+    settings.TASKS_ALWAYS_EAGER = True
+    calls.clear()
+    remember.delay('eager')
+    assert calls == ['eager']
+    assert not Task.objects.exists()
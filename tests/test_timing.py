@@ -0,0 +1,44 @@
+import pytest
+from blogicum.timing import histograms
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def reset_histograms():
+    histograms.reset()
+    yield
+    histograms.reset()
+
+
+def test_server_timing_header(client, post_with_published_location):
+    response = client.get('/')
+    header = response['Server-Timing']
+    for metric in ('total;dur=', 'sql;dur=', 'tpl;dur='):
+        assert metric in header, (
+            "Убедитесь, что заголовок `Server-Timing` содержит общее время,"
+            " время SQL-запросов и шаблонов."
+        )
+    assert 'queries"' in header
+
+
+def test_histograms_per_view(client, post_with_published_location):
+    for _ in range(3):
+        client.get('/')
+    client.get('/pages/about/')
+    stats = histograms.snapshot()
+    index = stats['blog:index']
+    assert index['count'] == 3 == sum(index['buckets']), (
+        "Убедитесь, что гистограмма задержек ведётся по имени представления."
+    )
+    assert index['queries'] > 0 and index['bytes'] > 0
+    assert index['template_ms'] > 0
+    assert index['p99_ms'] >= index['p50_ms'] > 0
+    assert stats['pages:about']['count'] == 1
+
+
+def test_sampling_off_disables_middleware(settings, client):
+    settings.REQUEST_TIMING_SAMPLE_RATE = 0
+    response = client.get('/pages/about/')
+    assert 'Server-Timing' not in response
+    assert histograms.snapshot() == {}